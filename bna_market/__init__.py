@@ -11,7 +11,6 @@ A data analytics platform for Nashville real estate market with:
 
 __version__ = "2.0.0"
 
-from bna_market.services import ETLService, run_etl
 from bna_market.core.config import settings, DATABASE_CONFIG, ZILLOW_CONFIG, FRED_CONFIG
 
 __all__ = [
@@ -22,3 +21,12 @@ __all__ = [
     "ZILLOW_CONFIG",
     "FRED_CONFIG",
 ]
+
+
+def __getattr__(name):
+    # The ETL service pulls in pandas, the pipelines and fredapi; import it on
+    # first access so the web app (which never runs the ETL) starts without them
+    if name in ("ETLService", "run_etl"):
+        from bna_market import services
+        return getattr(services, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -42,6 +42,14 @@ settings = {
     "supabase_db_password": os.getenv("SUPABASE_DB_PASSWORD", ""),
     # Pooler host varies by region (us-west-2, us-east-1, eu-central-1, etc.)
     "supabase_pooler_host": os.getenv("SUPABASE_POOLER_HOST", "aws-0-us-west-2.pooler.supabase.com"),
+
+    # PostgreSQL connection pool (per process): connections opened at start-up,
+    # hard limit, idle connections kept between requests, and seconds an idle
+    # connection may sit in the pool before it is closed instead of reused
+    "db_pool_min_conn": int(os.getenv("DB_POOL_MIN_CONN", "1")),
+    "db_pool_max_conn": int(os.getenv("DB_POOL_MAX_CONN", "10")),
+    "db_pool_max_idle": int(os.getenv("DB_POOL_MAX_IDLE", "10")),
+    "db_pool_idle_timeout": int(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
 }
 
 
@@ -68,6 +76,7 @@ ZILLOW_CONFIG = {
         "buildYearMin": 1990,
         "max_pages": 20,
         "page_delay": 0.5,
+        "max_workers": 5,
     },
     "rentals": {
         "minPrice": 1400,
@@ -81,6 +90,7 @@ ZILLOW_CONFIG = {
         "buildYearMin": 1979,
         "max_pages": 20,
         "page_delay": 0.5,
+        "max_workers": 5,
     },
 }
 
@@ -117,6 +127,7 @@ FRED_CONFIG = {
         "consumer_sentiment": "UMCSENT",             # Consumer Sentiment Index (National)
     },
     "years_historical": 2,  # 2023-present for compact charts
+    "max_workers": 4,  # Concurrent series requests (FRED allows 120 requests/min)
 }
 
 
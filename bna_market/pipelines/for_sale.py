@@ -49,6 +49,7 @@ def fetch_for_sale_properties() -> pd.DataFrame:
         api_key=api_key,
         max_pages=config["max_pages"],
         page_delay=config["page_delay"],
+        max_workers=config["max_workers"],
     )
 
     logger.info(f"Fetched {len(df)} for-sale properties")
@@ -5,7 +5,9 @@ Fetches Nashville MSA economic indicators from FRED API with retry logic and val
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Optional
 
 import pandas as pd
 from fredapi import Fred
@@ -55,6 +57,50 @@ def fetch_fred_series(
     )
 
 
+def fetch_metric_frame(
+    fred: Fred,
+    metric_name: str,
+    series_id: str,
+    start_date: str,
+    end_date: str
+) -> Optional[pd.DataFrame]:
+    """
+    Fetch one FRED series and shape it into long-format rows
+
+    Args:
+        fred: FRED API client instance
+        metric_name: Friendly metric name stored alongside the series
+        series_id: FRED series identifier
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        DataFrame with date, value, metric_name and series_id columns,
+        or None if the series could not be fetched
+    """
+    try:
+        logger.info(f"Fetching {metric_name} ({series_id})")
+
+        # Fetch series data with observation start/end dates
+        series = fetch_fred_series(fred, series_id, start_date, end_date)
+
+        # Convert to DataFrame with date formatting
+        # Date is converted to string format for SQLite compatibility
+        df = series.to_frame(name="value")
+        df["metric_name"] = metric_name
+        df["series_id"] = series_id
+        df.reset_index(inplace=True)
+        df.rename(columns={"index": "date"}, inplace=True)
+        df["date"] = df["date"].dt.strftime("%Y-%m-%d")
+
+        logger.debug(f"Fetched {len(df)} observations for {metric_name}")
+        return df
+
+    except Exception as e:
+        logger.warning(f"Error fetching {metric_name} ({series_id}): {e}")
+        return None
+
+
 def fetch_fred_metrics() -> pd.DataFrame:
     """
     Fetch FRED economic indicators for Nashville MSA
@@ -97,39 +143,28 @@ def fetch_fred_metrics() -> pd.DataFrame:
         f"({FRED_CONFIG['years_historical']} years)"
     )
 
-    # Fetch all series and combine into single DataFrame
-    all_data: list[pd.DataFrame] = []
+    # Fetch all series concurrently; each request is network-bound, so the
+    # total wait is roughly the slowest series instead of the sum of all.
+    # map() keeps results in config order for deterministic output.
     series_list = list(FRED_CONFIG["series_ids"].items())
-    failed_series: list[str] = []
-
-    for metric_name, series_id in series_list:
-        try:
-            logger.info(f"Fetching {metric_name} ({series_id})")
-
-            # Fetch series data with observation start/end dates
-            series = fetch_fred_series(
-                fred,
-                series_id,
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d")
-            )
-
-            # Convert to DataFrame with date formatting
-            # Date is converted to string format for SQLite compatibility
-            df = series.to_frame(name="value")
-            df["metric_name"] = metric_name
-            df["series_id"] = series_id
-            df.reset_index(inplace=True)
-            df.rename(columns={"index": "date"}, inplace=True)
-            df["date"] = df["date"].dt.strftime("%Y-%m-%d")
-
-            all_data.append(df)
-            logger.debug(f"Fetched {len(df)} observations for {metric_name}")
-
-        except Exception as e:
-            logger.warning(f"Error fetching {metric_name} ({series_id}): {e}")
-            failed_series.append(metric_name)
-            continue
+    start_str = start_date.strftime("%Y-%m-%d")
+    end_str = end_date.strftime("%Y-%m-%d")
+
+    with ThreadPoolExecutor(
+        max_workers=FRED_CONFIG["max_workers"],
+        thread_name_prefix="fred"
+    ) as executor:
+        frames = list(executor.map(
+            lambda item: fetch_metric_frame(fred, item[0], item[1], start_str, end_str),
+            series_list
+        ))
+
+    all_data: list[pd.DataFrame] = [df for df in frames if df is not None]
+    failed_series: list[str] = [
+        metric_name
+        for (metric_name, _), df in zip(series_list, frames)
+        if df is None
+    ]
 
     # Alert if too many series failed (more than 50%)
     success_count = len(all_data)
@@ -6,7 +6,6 @@ Fetches rental property listings from Zillow API with unit parsing for multi-uni
 
 import ast
 import json
-import re
 from typing import Any
 
 import pandas as pd
@@ -17,6 +16,9 @@ from bna_market.utils.logger import setup_logger
 
 logger = setup_logger("rental_pipeline")
 
+# Single-pass translation of Python-style quotes for the JSON fallback
+_SINGLE_TO_DOUBLE_QUOTES = str.maketrans({"'": '"'})
+
 
 def parse_units(x: Any) -> list[dict[str, Any]] | None:
     """
@@ -39,17 +41,28 @@ def parse_units(x: Any) -> list[dict[str, Any]] | None:
     if not isinstance(x, str):
         return None
 
-    # Try literal_eval first (for Python literal strings)
+    # Only list literals can yield units; skip empty and scalar strings early
+    s = x.lstrip()
+    if not s or s[0] != "[":
+        return None
+
+    # Try JSON first (cheap C parser), then Python literal strings
+    try:
+        result = json.loads(s)
+        return result if isinstance(result, list) else None
+    except ValueError:
+        pass
+
     try:
-        result = ast.literal_eval(x)
+        result = ast.literal_eval(s)
         return result if isinstance(result, list) else None
     except (ValueError, SyntaxError):
         pass
 
-    # Try JSON parsing with boolean replacements
+    # Try JSON parsing with boolean and quote replacements
     try:
-        s = x.replace("False", "false").replace("True", "true")
-        s = re.sub(r"'", '"', s)
+        s = s.replace("False", "false").replace("True", "true")
+        s = s.translate(_SINGLE_TO_DOUBLE_QUOTES)
         result = json.loads(s)
         return result if isinstance(result, list) else None
     except (ValueError, json.JSONDecodeError):
@@ -57,6 +70,34 @@ def parse_units(x: Any) -> list[dict[str, Any]] | None:
         return None
 
 
+def explode_units(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Expand multi-unit listings into one row per unit
+
+    Each unit's fields are added as '_unit'-suffixed columns. Listings whose
+    units cannot be parsed keep a single row with no unit values. The
+    expansion is built in one pass: the listing rows are repeated with
+    Index.repeat and the unit dicts become a single frame, instead of
+    building a Series per row.
+
+    Args:
+        df: Rental listings with a 'units' column
+
+    Returns:
+        DataFrame with one row per unit (index repeated per listing)
+
+    Example:
+        >>> df = pd.DataFrame({"zpid": [1], "units": ["[{'beds': 1}, {'beds': 2}]"]})
+        >>> explode_units(df)["beds_unit"].tolist()
+        [1, 2]
+    """
+    parsed = [parse_units(x) or [{}] for x in df["units"]]
+    base = df.loc[df.index.repeat([len(units) for units in parsed])]
+    unit_rows = [unit if isinstance(unit, dict) else {} for units in parsed for unit in units]
+    unit_cols = pd.DataFrame.from_records(unit_rows, index=base.index).add_suffix("_unit")
+    return pd.concat([base, unit_cols], axis=1)
+
+
 def fetch_rental_properties() -> pd.DataFrame:
     """
     Fetch rental property listings from Zillow API
@@ -95,18 +136,15 @@ def fetch_rental_properties() -> pd.DataFrame:
         api_key=api_key,
         max_pages=config["max_pages"],
         page_delay=config["page_delay"],
+        max_workers=config["max_workers"],
     )
 
     # Parse and explode units if column exists and DataFrame is not empty
     if not df.empty and "units" in df.columns:
         logger.info("Parsing units column for multi-unit properties")
-        df["parsed"] = df["units"].apply(parse_units)
-        df = df.explode("parsed")
-
-        # Extract unit fields and add as separate columns
-        new_cols = df["parsed"].apply(pd.Series).add_suffix("_unit")
-        df = pd.concat([df.drop(columns=["parsed"]), new_cols], axis=1)
-        logger.info(f"Units parsed and exploded into {len(new_cols.columns)} unit-specific columns")
+        column_count = len(df.columns)
+        df = explode_units(df)
+        logger.info(f"Units parsed and exploded into {len(df.columns) - column_count} unit-specific columns")
 
     logger.info(f"Fetched {len(df)} rental units")
     return df
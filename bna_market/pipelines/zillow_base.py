@@ -6,24 +6,64 @@ Eliminates code duplication between forSale and rental pipelines.
 
 import requests
 import pandas as pd
+import threading
 import time
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bna_market.utils.logger import setup_logger
-from bna_market.utils.retry import retry_with_backoff
 from bna_market.utils.validators import validate_zillow_dataframe
 from bna_market.core.config import NASHVILLE_POLYGON
 
 logger = setup_logger("zillow_pipeline")
 
+ZILLOW_API_HOST = "zillow-com1.p.rapidapi.com"
+ZILLOW_POLYGON_URL = f"https://{ZILLOW_API_HOST}/propertyByPolygon"
+
+# Pipeline settings that live in ZILLOW_CONFIG but are not API query parameters
+PIPELINE_CONFIG_KEYS = {"max_pages", "page_delay", "max_workers"}
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps connections to the Zillow API alive
+
+    Reusing connections skips a TCP + TLS handshake per page. The adapter
+    retries connection errors and 429/5xx responses with exponential backoff,
+    honouring Retry-After on rate-limit responses. Its pool is sized above
+    the largest page-fetch thread pool. The RapidAPI host header is fixed,
+    so it is set once here; callers only pass the API key.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({"x-rapidapi-host": ZILLOW_API_HOST})
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across page-fetch threads (requests sessions are safe for concurrent GETs)
+_session = create_session()
+
 
-@retry_with_backoff(max_retries=3, base_delay=1.0)
 def fetch_single_page(url: str, headers: Dict, params: Dict) -> Dict:
     """
-    Fetch single page with retry logic
+    Fetch single page over the shared session (retries happen in its adapter)
 
     Args:
         url: API endpoint URL
-        headers: Request headers including API key
+        headers: Per-request headers (the API key; the host is set on the session)
         params: Query parameters
 
     Returns:
@@ -32,65 +72,140 @@ def fetch_single_page(url: str, headers: Dict, params: Dict) -> Dict:
     Raises:
         requests.exceptions.RequestException: On HTTP errors
     """
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = _session.get(url, headers=headers, params=params, timeout=30)
     response.raise_for_status()
     return response.json()
 
 
+class RateGate:
+    """
+    Space out calls shared by several threads to at most one per interval
+
+    Each caller reserves the next free slot under a lock and sleeps until
+    that slot outside it, so the aggregate rate across threads stays at
+    1/interval however many workers are fetching.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Block until this caller's slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def fetch_listing_page(
+    url: str, headers: Dict, params: Dict, page: int, status_type: str, gate: RateGate
+) -> Optional[Dict]:
+    """
+    Fetch one listing page, logging failures instead of raising
+
+    Args:
+        url: API endpoint URL
+        headers: Per-request headers (the API key; the host is set on the session)
+        params: Query parameters for this page
+        page: Page number (for logging)
+        status_type: 'ForSale' or 'ForRent' (for logging)
+        gate: Rate gate shared by every worker of this fetch
+
+    Returns:
+        JSON response as dictionary, or None if the request failed
+    """
+    try:
+        gate.wait()
+        logger.info(f"Fetching {status_type} page {page}")
+        return fetch_single_page(url, headers, params)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Request failed on page {page}: {e}")
+    except ValueError as e:
+        logger.error(f"JSON decode error on page {page}: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error on page {page}: {e}")
+    return None
+
+
 def fetch_zillow_listings(
-    status_type: str, config: Dict, api_key: str, max_pages: int = 20, page_delay: float = 0.5
+    status_type: str,
+    config: Dict,
+    api_key: str,
+    max_pages: int = 20,
+    page_delay: float = 0.5,
+    max_workers: int = 5,
 ) -> pd.DataFrame:
     """
     Generic Zillow listing fetcher for both for-sale and rental properties
 
+    Page 1 is fetched first to learn totalPages; the remaining pages are
+    fetched in concurrent batches of max_workers. Results are consumed in
+    page order and pagination stops at the first empty or failed page, as
+    with a serial fetch. Requests from all workers pass through one
+    RateGate, so the overall request rate stays at 1/page_delay.
+
     Args:
         status_type: 'ForSale' or 'ForRent'
         config: Dictionary with minPrice, maxPrice, beds, baths, sqft, buildYear
         api_key: RapidAPI key
         max_pages: Maximum pages to fetch
-        page_delay: Delay between requests in seconds
+        page_delay: Minimum seconds between requests, across all workers
+        max_workers: Maximum concurrent page requests
 
     Returns:
         DataFrame with property listings
     """
-    url = "https://zillow-com1.p.rapidapi.com/propertyByPolygon"
+    url = ZILLOW_POLYGON_URL
     polygon_coords = f"{NASHVILLE_POLYGON['west']} {NASHVILLE_POLYGON['north']}, {NASHVILLE_POLYGON['east']} {NASHVILLE_POLYGON['north']}, {NASHVILLE_POLYGON['east']} {NASHVILLE_POLYGON['south']}, {NASHVILLE_POLYGON['west']} {NASHVILLE_POLYGON['south']}, {NASHVILLE_POLYGON['west']} {NASHVILLE_POLYGON['north']}"
 
-    headers = {"x-rapidapi-key": api_key, "x-rapidapi-host": "zillow-com1.p.rapidapi.com"}
+    headers = {"x-rapidapi-key": api_key}
 
-    all_properties = []
+    base_params = {
+        "polygon": polygon_coords,
+        "status_type": status_type,
+        **{k: str(v) for k, v in config.items() if k not in PIPELINE_CONFIG_KEYS},
+    }
 
-    for page in range(1, max_pages + 1):
-        querystring = {
-            "polygon": polygon_coords,
-            "status_type": status_type,
-            "page": str(page),
-            **{k: str(v) for k, v in config.items() if k not in ["max_pages", "page_delay"]},
-        }
+    gate = RateGate(page_delay)
+
+    def fetch_page(page: int) -> Optional[Dict]:
+        params = {**base_params, "page": str(page)}
+        return fetch_listing_page(url, headers, params, page, status_type, gate)
+
+    def collect(page: int, data: Optional[Dict]) -> bool:
+        """Add a page's properties; return False when pagination should stop"""
+        if data is None:
+            return False
+        properties = data.get("props", [])
+        if not properties:
+            logger.info(f"No more properties found at page {page}, stopping pagination")
+            return False
+        all_properties.extend(properties)
+        logger.debug(f"Retrieved {len(properties)} properties from page {page}")
+        return True
+
+    all_properties = []
 
+    first_page = fetch_page(1)
+    if collect(1, first_page):
+        # Only request pages the API says exist; fall back to max_pages if
+        # totalPages is missing (batches then stop at the first empty page)
         try:
-            logger.info(f"Fetching {status_type} page {page}/{max_pages}")
-            data = fetch_single_page(url, headers, querystring)
-            properties = data.get("props", [])
-
-            if not properties:
-                logger.info(f"No more properties found at page {page}, stopping pagination")
-                break
-
-            all_properties.extend(properties)
-            logger.debug(f"Retrieved {len(properties)} properties from page {page}")
-
-            time.sleep(page_delay)
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed on page {page}: {e}")
-            break
-        except ValueError as e:
-            logger.error(f"JSON decode error on page {page}: {e}")
-            break
-        except Exception as e:
-            logger.error(f"Unexpected error on page {page}: {e}")
-            break
+            last_page = min(int(first_page.get("totalPages") or max_pages), max_pages)
+        except (TypeError, ValueError):
+            last_page = max_pages
+
+        workers = max(1, max_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zillow") as executor:
+            for batch_start in range(2, last_page + 1, workers):
+                pages = range(batch_start, min(batch_start + workers, last_page + 1))
+                results = executor.map(fetch_page, pages)
+                if not all(collect(page, data) for page, data in zip(pages, results)):
+                    break
 
     if all_properties:
         logger.info(f"Total {status_type} properties retrieved: {len(all_properties)}")
@@ -2,16 +2,28 @@
 Database utilities for BNA Market application
 
 Provides Supabase client and PostgreSQL connection management for database operations.
+
+pandas and the Supabase client are imported on first use: only the ETL needs
+them, and the web app imports this module for its connection pool alone.
 """
 
-import pandas as pd
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
 import psycopg2
+import psycopg2.extensions
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
 from typing import Optional, Any
 from urllib.parse import urlparse
 
-from supabase import create_client, Client
+if TYPE_CHECKING:
+    import pandas as pd
+    from supabase import Client
 
 from bna_market.utils.logger import setup_logger
 from bna_market.core.config import SUPABASE_CONFIG, DATABASE_CONFIG, settings
@@ -21,6 +33,24 @@ logger = setup_logger("database")
 # Supabase client singleton
 _supabase_client: Optional[Client] = None
 
+# PostgreSQL connection pool (created on first use; sizes come from DB_POOL_* env vars)
+POOL_MIN_CONN = settings["db_pool_min_conn"]
+POOL_MAX_CONN = settings["db_pool_max_conn"]
+POOL_MAX_IDLE = min(settings["db_pool_max_idle"], POOL_MAX_CONN)
+POOL_IDLE_TIMEOUT = settings["db_pool_idle_timeout"]
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+# Return NUMERIC columns as float instead of Decimal for every connection in the
+# process; all consumers (JSON responses, pandas) want floats, so this avoids
+# converting row by row
+DEC2FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    "DEC2FLOAT",
+    lambda value, cursor: float(value) if value is not None else None,
+)
+psycopg2.extensions.register_type(DEC2FLOAT)
+
 
 def get_supabase_client(use_service_key: bool = False) -> Client:
     """
@@ -37,6 +67,7 @@ def get_supabase_client(use_service_key: bool = False) -> Client:
         ValueError: If Supabase URL or key is not configured
     """
     global _supabase_client
+    from supabase import create_client
 
     url = SUPABASE_CONFIG["url"]
     key = SUPABASE_CONFIG["service_key"] if use_service_key else SUPABASE_CONFIG["anon_key"]
@@ -91,13 +122,153 @@ def get_postgres_connection_string() -> str:
     return f"postgresql://postgres.{project_ref}:{service_key}@{pg_host}:5432/postgres"
 
 
+def _connection_kwargs() -> dict:
+    """
+    Build psycopg2 connection parameters for Supabase PostgreSQL via the pooler
+
+    Returns:
+        Keyword arguments for psycopg2.connect()
+
+    Raises:
+        ValueError: If SUPABASE_URL or SUPABASE_DB_PASSWORD is not configured
+    """
+    # Get connection parameters from Supabase config
+    url = SUPABASE_CONFIG["url"]
+    db_password = settings.get("supabase_db_password", "")
+
+    if not url:
+        raise ValueError("SUPABASE_URL must be set")
+    if not db_password:
+        raise ValueError("SUPABASE_DB_PASSWORD must be set for database connections")
+
+    # Parse project reference from URL
+    parsed = urlparse(url)
+    project_ref = parsed.netloc.split(".")[0]
+
+    # Connect to Supabase PostgreSQL via pooler
+    # Note: Pooler requires database password, NOT service_role key
+    pooler_host = settings.get("supabase_pooler_host", "aws-0-us-west-2.pooler.supabase.com")
+    return {
+        "host": pooler_host,
+        "port": 6543,
+        "database": "postgres",
+        "user": f"postgres.{project_ref}",
+        "password": db_password,
+        "sslmode": "require",
+        # Fail fast instead of hanging a worker when the pooler is unreachable
+        "connect_timeout": 10,
+        # Identifies our sessions in pg_stat_activity
+        "application_name": "bna-market",
+        # TCP keepalives stop idle pooled sockets being dropped by the pooler or
+        # NAT, and detect dead peers instead of hanging on the next query
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+    }
+
+
+class IdleTimeoutConnectionPool(ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that keeps connections between requests
+
+    psycopg2's pool only keeps minconn idle connections and closes any others
+    on putconn, so concurrent requests beyond minconn each paid a new TCP + TLS
+    + auth handshake. Here minconn only sizes the warm-up: up to max_idle
+    connections are kept, and one left idle for more than idle_timeout seconds
+    is closed on checkout and replaced with a fresh connection.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, max_idle: int, idle_timeout: float,
+                 *args, **kwargs):
+        self.idle_timeout = idle_timeout
+        self._idle_since = {}
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        # After the warm-up, minconn is only psycopg2's idle retention limit
+        self.minconn = max_idle
+
+    def _getconn(self, key=None):
+        while True:
+            conn = super()._getconn(key)
+            idle_since = self._idle_since.pop(id(conn), None)
+            if idle_since is None or time.monotonic() - idle_since <= self.idle_timeout:
+                return conn
+            key = self._rused[id(conn)]
+            super()._putconn(conn, key, close=True)
+
+    def _putconn(self, conn, key=None, close=False):
+        super()._putconn(conn, key, close)
+        if not conn.closed:
+            self._idle_since[id(conn)] = time.monotonic()
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    """Get the process-wide connection pool, creating it on first use"""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = IdleTimeoutConnectionPool(
+                    POOL_MIN_CONN, POOL_MAX_CONN, POOL_MAX_IDLE, POOL_IDLE_TIMEOUT,
+                    **_connection_kwargs()
+                )
+                logger.info(f"PostgreSQL connection pool created (max {POOL_MAX_CONN} connections)")
+
+    return _pool
+
+
+def _connect():
+    """
+    Check out a connection from the pool
+
+    Returns:
+        psycopg2 connection object; hand it back with _release()
+    """
+    pool = _get_pool()
+    conn = pool.getconn()
+
+    # Replace connections that were closed while idle in the pool
+    while conn.closed:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+
+    return conn
+
+
+def _release(conn) -> None:
+    """Return a connection to the pool with default session settings"""
+    pool = _get_pool()
+
+    if conn.closed:
+        pool.putconn(conn, close=True)
+        return
+
+    try:
+        if conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+        conn.autocommit = False
+        conn.readonly = None
+        pool.putconn(conn)
+    except psycopg2.Error:
+        # Connection is unusable; drop it rather than hand it to the next request
+        pool.putconn(conn, close=True)
+
+
 @contextmanager
-def get_db_connection():
+def get_db_connection(statement_timeout: Optional[str] = None, readonly: bool = False):
     """
     Context manager for PostgreSQL database connections with automatic commit/rollback
 
     Uses Supabase's PostgreSQL database directly for SQL queries.
     This maintains compatibility with the existing cursor-based query pattern.
+    Connections are borrowed from a process-wide pool and returned on exit.
+
+    Args:
+        statement_timeout: Optional per-transaction timeout (e.g. "2s") applied
+                           with SET LOCAL, so it ends with the transaction
+        readonly: Open the transaction as BEGIN READ ONLY (no extra round trip),
+                  so Postgres rejects writes and skips write bookkeeping
 
     Yields:
         psycopg2 connection object
@@ -109,43 +280,71 @@ def get_db_connection():
     """
     conn = None
     try:
-        # Get connection parameters from Supabase config
-        url = SUPABASE_CONFIG["url"]
-        db_password = settings.get("supabase_db_password", "")
-
-        if not url:
-            raise ValueError("SUPABASE_URL must be set")
-        if not db_password:
-            raise ValueError("SUPABASE_DB_PASSWORD must be set for database connections")
-
-        # Parse project reference from URL
-        parsed = urlparse(url)
-        project_ref = parsed.netloc.split(".")[0]
-
-        # Connect to Supabase PostgreSQL via pooler
-        # Note: Pooler requires database password, NOT service_role key
-        pooler_host = settings.get("supabase_pooler_host", "aws-0-us-west-2.pooler.supabase.com")
-        conn = psycopg2.connect(
-            host=pooler_host,
-            port=6543,
-            database="postgres",
-            user=f"postgres.{project_ref}",
-            password=db_password,
-            sslmode="require",
-        )
+        conn = _connect()
+
+        if readonly:
+            conn.readonly = True
+
+        if statement_timeout:
+            conn.cursor().execute("SET LOCAL statement_timeout = %s", (statement_timeout,))
 
         yield conn
         conn.commit()
 
     except Exception as e:
-        if conn:
+        if conn and not conn.closed:
             conn.rollback()
         logger.error(f"Database transaction failed: {e}")
         raise
 
     finally:
         if conn:
-            conn.close()
+            _release(conn)
+
+
+@contextmanager
+def get_ro_connection():
+    """
+    Context manager for read-only PostgreSQL connections
+
+    The connection runs in autocommit mode, so each SELECT executes on its own
+    without the BEGIN/COMMIT round trips of a transaction. The session is also
+    marked read-only (default_transaction_read_only), so Postgres rejects any
+    write issued on it; anything that writes should use get_db_connection().
+
+    Note: named (server-side) cursors require a transaction and cannot be
+    used on these connections.
+
+    Yields:
+        psycopg2 connection object with autocommit and readonly enabled
+
+    Example:
+        with get_ro_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM user_property_lists WHERE user_id = %s", (user_id,))
+    """
+    conn = None
+    try:
+        conn = _connect()
+        conn.set_session(readonly=True, autocommit=True)
+
+        yield conn
+
+    except Exception as e:
+        logger.error(f"Read-only query failed: {e}")
+        raise
+
+    finally:
+        if conn:
+            _release(conn)
+
+
+def __getattr__(name: str):
+    # Keep database.pd resolvable (e.g. for mock.patch) without importing pandas up front
+    if name == "pd":
+        import pandas
+        return pandas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Valid table names whitelist to prevent SQL injection
@@ -170,6 +369,8 @@ def read_table_safely(table_name: str, conn: Any = None) -> pd.DataFrame:
     Raises:
         ValueError: If table_name is not in the allowed whitelist
     """
+    import pandas as pd
+
     # Normalize table name to lowercase for PostgreSQL
     table_name_lower = table_name.lower()
 
@@ -273,6 +474,7 @@ def upsert_dataframe(
 
         # Replace NaN/inf with None for JSON serialization
         import numpy as np
+        import pandas as pd
         df = df.replace([np.nan, np.inf, -np.inf], None)
 
         # Convert float columns that should be integers
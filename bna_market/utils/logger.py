@@ -4,20 +4,43 @@ Logging infrastructure for BNA Market application
 Provides structured logging with timestamps, log levels, and both console and file output.
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from datetime import datetime
 from typing import Optional
 
 
-def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that defers traceback formatting to the listener
+
+    The message is merged with its args in the calling thread, so later
+    changes to mutable args can't alter it and formatting errors are
+    reported at the call site. Unlike the stock QueueHandler, the traceback
+    (the expensive part) is left for the listener thread to format.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logger(name: str, level: int = logging.INFO, use_queue: bool = False) -> logging.Logger:
     """
     Configure structured logging with timestamps
 
     Args:
         name: Logger name (typically module name)
         level: Logging level (default: INFO)
+        use_queue: Emit through a background QueueListener so request threads
+                   don't block on traceback formatting or handler I/O
 
     Returns:
         Configured logger instance
@@ -61,4 +84,17 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         # Console logging will still work
         logger.debug(f"File logging disabled: {e}")
 
+    if use_queue:
+        # Move the console/file handlers behind a queue drained by a listener thread
+        handlers = list(logger.handlers)
+        for handler in handlers:
+            logger.removeHandler(handler)
+
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+        logger.addHandler(_DeferredQueueHandler(log_queue))
+
     return logger
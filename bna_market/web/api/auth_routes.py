@@ -16,7 +16,7 @@ from bna_market.web.auth.middleware import require_auth
 from bna_market.utils.database import get_supabase_client
 from bna_market.utils.logger import setup_logger
 
-logger = setup_logger("auth_api")
+logger = setup_logger("auth_api", use_queue=True)
 
 # Create auth blueprint
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
@@ -17,7 +17,7 @@ from bna_market.utils.database import get_db_connection
 from bna_market.utils.logger import setup_logger
 import psycopg2.errors
 
-logger = setup_logger("crm_api")
+logger = setup_logger("crm_api", use_queue=True)
 
 # Create CRM blueprint
 crm_bp = Blueprint("crm", __name__, url_prefix="/api/crm")
@@ -77,14 +77,14 @@ def get_leads():
             for row in cursor.fetchall():
                 lead = dict(zip(columns, row))
                 leads.append({
-                    "id": str(lead['id']),
+                    "id": lead['id'],
                     "propertyZpid": lead['property_zpid'],
                     "name": lead['name'],
                     "email": lead['email'],
                     "phone": lead['phone'],
                     "message": lead['message'],
                     "status": lead['status'],
-                    "assignedTo": str(lead['assigned_to']) if lead['assigned_to'] else None,
+                    "assignedTo": lead['assigned_to'],
                     "tags": lead['tags'] or [],
                     "nextFollowUpDate": lead['next_follow_up_date'].isoformat() if lead['next_follow_up_date'] else None,
                     "notes": lead['notes'],
@@ -150,7 +150,7 @@ def create_lead():
             logger.info(f"Lead created: {result[0]} for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "propertyZpid": result[1],
                 "name": result[2],
                 "email": result[3],
@@ -195,14 +195,14 @@ def get_lead(lead_id):
             lead = dict(zip(columns, row))
 
             return jsonify({
-                "id": str(lead['id']),
+                "id": lead['id'],
                 "propertyZpid": lead['property_zpid'],
                 "name": lead['name'],
                 "email": lead['email'],
                 "phone": lead['phone'],
                 "message": lead['message'],
                 "status": lead['status'],
-                "assignedTo": str(lead['assigned_to']) if lead['assigned_to'] else None,
+                "assignedTo": lead['assigned_to'],
                 "tags": lead['tags'] or [],
                 "nextFollowUpDate": lead['next_follow_up_date'].isoformat() if lead['next_follow_up_date'] else None,
                 "notes": lead['notes'],
@@ -279,7 +279,7 @@ def update_lead(lead_id):
             logger.info(f"Lead updated: {lead_id} for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "propertyZpid": result[1],
                 "name": result[2],
                 "email": result[3],
@@ -348,8 +348,8 @@ def get_alerts():
             alerts = []
             for row in cursor.fetchall():
                 alerts.append({
-                    "id": str(row[0]),
-                    "savedSearchId": str(row[1]) if row[1] else None,
+                    "id": row[0],
+                    "savedSearchId": row[1],
                     "alertType": row[2],
                     "enabled": row[3],
                     "frequency": row[4],
@@ -411,8 +411,8 @@ def create_alert():
             logger.info(f"Alert created: {result[0]} for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
-                "savedSearchId": str(result[1]),
+                "id": result[0],
+                "savedSearchId": result[1],
                 "alertType": result[2],
                 "enabled": result[3],
                 "frequency": result[4],
@@ -471,7 +471,7 @@ def update_alert(alert_id):
                 return jsonify({"error": "Alert not found"}), 404
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "enabled": result[1],
                 "frequency": result[2],
                 "updatedAt": result[3].isoformat()
@@ -531,7 +531,7 @@ def get_comps():
             comps = []
             for row in cursor.fetchall():
                 comps.append({
-                    "id": str(row[0]),
+                    "id": row[0],
                     "name": row[1],
                     "subjectZpid": row[2],
                     "compZpids": row[3] or [],
@@ -597,7 +597,7 @@ def create_comp():
             logger.info(f"Comp created: {result[0]} for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "name": result[1],
                 "subjectZpid": result[2],
                 "compZpids": result[3] or [],
@@ -636,7 +636,7 @@ def get_comp(comp_id):
                 return jsonify({"error": "Comparison not found"}), 404
 
             return jsonify({
-                "id": str(row[0]),
+                "id": row[0],
                 "name": row[1],
                 "subjectZpid": row[2],
                 "compZpids": row[3] or [],
@@ -708,7 +708,7 @@ def get_portfolios():
             for row in cursor.fetchall():
                 monthly_cash_flow = float(row[8] or 0) - float(row[9] or 0)
                 portfolios.append({
-                    "id": str(row[0]),
+                    "id": row[0],
                     "name": row[1],
                     "description": row[2],
                     "targetReturn": float(row[3]) if row[3] else None,
@@ -771,7 +771,7 @@ def create_portfolio():
             logger.info(f"Portfolio created: {result[0]} for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "name": result[1],
                 "description": result[2],
                 "targetReturn": float(result[3]) if result[3] else None,
@@ -811,7 +811,7 @@ def get_portfolio(portfolio_id):
                 return jsonify({"error": "Portfolio not found"}), 404
 
             portfolio = {
-                "id": str(row[0]),
+                "id": row[0],
                 "name": row[1],
                 "description": row[2],
                 "targetReturn": float(row[3]) if row[3] else None,
@@ -837,7 +837,7 @@ def get_portfolio(portfolio_id):
 
             for prop in cursor.fetchall():
                 p = {
-                    "id": str(prop[0]),
+                    "id": prop[0],
                     "zpid": prop[1],
                     "purchasePrice": float(prop[2]) if prop[2] else None,
                     "purchaseDate": prop[3].isoformat() if prop[3] else None,
@@ -923,7 +923,7 @@ def update_portfolio(portfolio_id):
                 return jsonify({"error": "Portfolio not found"}), 404
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "name": result[1],
                 "description": result[2],
                 "targetReturn": float(result[3]) if result[3] else None,
@@ -1033,7 +1033,7 @@ def add_portfolio_property(portfolio_id):
             logger.info(f"Property {data['zpid']} added to portfolio {portfolio_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "portfolioId": portfolio_id,
                 "zpid": result[1],
                 "purchasePrice": float(result[2]) if result[2] else None,
@@ -1107,7 +1107,7 @@ def update_portfolio_property(portfolio_id, property_id):
                 return jsonify({"error": "Property not found"}), 404
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "zpid": result[1],
                 "purchasePrice": float(result[2]) if result[2] else None,
                 "currentValue": float(result[3]) if result[3] else None,
@@ -15,19 +15,85 @@ Endpoints:
 - PUT /api/lists/<list_id>/items/<item_id> - Update item notes
 """
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, Response, request, jsonify, g, stream_with_context
 from bna_market.web.auth.middleware import require_auth
 from bna_market.web.app import limiter
-from bna_market.utils.database import get_db_connection
+from bna_market.utils.database import get_db_connection, get_ro_connection
 from bna_market.utils.logger import setup_logger
-from uuid import UUID
+from uuid import uuid4
+import orjson
 import psycopg2.errors
 
-logger = setup_logger("lists_api")
+logger = setup_logger("lists_api", use_queue=True)
 
 # Create lists blueprint
 lists_bp = Blueprint("lists", __name__, url_prefix="/api/lists")
 
+# Lists with more items than this are streamed from a server-side cursor
+# instead of being buffered in memory before serialization
+STREAM_ITEMS_THRESHOLD = 500
+STREAM_BATCH_SIZE = 500
+
+# Upper bound for statements run by write handlers
+WRITE_STATEMENT_TIMEOUT = "2s"
+
+ALLOWED_PROPERTY_TYPES = frozenset({"rental", "forsale"})
+
+LIST_ITEMS_QUERY = """
+    SELECT id, zpid, property_type, notes, added_at
+    FROM user_property_list_items
+    WHERE list_id = %s
+    ORDER BY added_at DESC
+"""
+
+
+def _list_item_to_dict(row) -> dict:
+    """Convert a user_property_list_items row to its JSON representation"""
+    return {
+        "id": row[0],
+        "zpid": row[1],
+        "propertyType": row[2],
+        "notes": row[3],
+        "addedAt": row[4]
+    }
+
+
+def _stream_list_items(list_data: dict, list_id: str):
+    """
+    Yield a list payload as JSON, encoding items in batches
+
+    Items are read through a named (server-side) cursor so only one batch
+    of rows is held in memory at a time, regardless of list size.
+    """
+    # Emit the list fields first, leaving the object open for "items"
+    yield orjson.dumps(list_data)[:-1] + b',"items":['
+
+    try:
+        # Named cursors need a transaction, so this can't use get_ro_connection()
+        with get_db_connection() as conn:
+            cursor = conn.cursor(name=f"items_{uuid4().hex}")
+            cursor.itersize = STREAM_BATCH_SIZE
+            cursor.execute(LIST_ITEMS_QUERY, (list_id,))
+
+            first = True
+            while True:
+                rows = cursor.fetchmany(STREAM_BATCH_SIZE)
+                if not rows:
+                    break
+
+                chunk = b",".join(orjson.dumps(_list_item_to_dict(row)) for row in rows)
+                yield chunk if first else b"," + chunk
+                first = False
+
+            cursor.close()
+
+    except Exception as e:
+        # Headers are already sent, so the client sees a truncated body
+        logger.error(f"Stream list items error for list {list_id}: {e}", exc_info=True)
+        raise
+
+    yield b"]}"
+
 
 @lists_bp.route("", methods=["GET"])
 @require_auth
@@ -56,7 +122,7 @@ def get_user_lists():
         500: Server error
     """
     try:
-        with get_db_connection() as conn:
+        with get_ro_connection() as conn:
             cursor = conn.cursor()
 
             # Get lists with item counts
@@ -76,12 +142,12 @@ def get_user_lists():
             for row in cursor.fetchall():
                 list_data = dict(zip(columns, row))
                 lists.append({
-                    "id": str(list_data['id']),
+                    "id": list_data['id'],
                     "name": list_data['name'],
                     "description": list_data['description'],
                     "itemCount": list_data['item_count'],
-                    "createdAt": list_data['created_at'].isoformat() if list_data['created_at'] else None,
-                    "updatedAt": list_data['updated_at'].isoformat() if list_data['updated_at'] else None
+                    "createdAt": list_data['created_at'],
+                    "updatedAt": list_data['updated_at']
                 })
 
             logger.debug(f"Retrieved {len(lists)} lists for user {g.user_id}")
@@ -130,38 +196,40 @@ def create_list():
         if len(name) > 100:
             return jsonify({"error": "List name must be 100 characters or less"}), 400
 
-        with get_db_connection() as conn:
+        with get_db_connection(statement_timeout=WRITE_STATEMENT_TIMEOUT) as conn:
             cursor = conn.cursor()
 
-            # Insert new list
+            # Insert new list; names are unique per user, case-insensitively
             cursor.execute("""
                 INSERT INTO user_property_lists (user_id, name, description)
                 VALUES (%s, %s, %s)
+                ON CONFLICT (user_id, lower(name)) DO NOTHING
                 RETURNING id, name, description, created_at, updated_at
             """, (g.user_id, name, description or None))
 
             result = cursor.fetchone()
 
+            if not result:
+                logger.warning(f"Duplicate list name '{name}' for user {g.user_id}")
+                return jsonify({"error": "A list with this name already exists"}), 409
+
             logger.info(f"List created: {result[0]} - '{result[1]}' for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "name": result[1],
                 "description": result[2],
                 "itemCount": 0,
-                "createdAt": result[3].isoformat(),
-                "updatedAt": result[4].isoformat()
+                "createdAt": result[3],
+                "updatedAt": result[4]
             }), 201
 
-    except psycopg2.errors.UniqueViolation:
-        logger.warning(f"Duplicate list name '{name}' for user {g.user_id}")
-        return jsonify({"error": "A list with this name already exists"}), 409
     except Exception as e:
         logger.error(f"Create list error: {e}", exc_info=True)
         return jsonify({"error": "Failed to create list"}), 500
 
 
-@lists_bp.route("/<list_id>", methods=["GET"])
+@lists_bp.route("/<uuid:list_id>", methods=["GET"])
 @require_auth
 @limiter.limit("60 per minute")
 def get_list_with_items(list_id):
@@ -174,14 +242,16 @@ def get_list_with_items(list_id):
         500: Server error
     """
     try:
-        with get_db_connection() as conn:
+        with get_ro_connection() as conn:
             cursor = conn.cursor()
 
-            # Get list info
+            # Get list info and item count
             cursor.execute("""
-                SELECT id, name, description, created_at, updated_at
-                FROM user_property_lists
-                WHERE id = %s AND user_id = %s
+                SELECT l.id, l.name, l.description, l.created_at, l.updated_at,
+                       (SELECT COUNT(*) FROM user_property_list_items i
+                        WHERE i.list_id = l.id) as item_count
+                FROM user_property_lists l
+                WHERE l.id = %s AND l.user_id = %s
             """, (list_id, g.user_id))
 
             list_row = cursor.fetchone()
@@ -190,30 +260,26 @@ def get_list_with_items(list_id):
                 return jsonify({"error": "List not found"}), 404
 
             list_data = {
-                "id": str(list_row[0]),
+                "id": list_row[0],
                 "name": list_row[1],
                 "description": list_row[2],
-                "createdAt": list_row[3].isoformat(),
-                "updatedAt": list_row[4].isoformat()
+                "createdAt": list_row[3],
+                "updatedAt": list_row[4],
+                "itemCount": list_row[5]
             }
 
+            # Large lists are streamed on a separate connection after this one is released
+            if list_data["itemCount"] > STREAM_ITEMS_THRESHOLD:
+                logger.debug(f"Streaming {list_data['itemCount']} items for list {list_id}")
+                return Response(
+                    stream_with_context(_stream_list_items(list_data, list_id)),
+                    mimetype="application/json"
+                )
+
             # Get list items
-            cursor.execute("""
-                SELECT id, zpid, property_type, notes, added_at
-                FROM user_property_list_items
-                WHERE list_id = %s
-                ORDER BY added_at DESC
-            """, (list_id,))
+            cursor.execute(LIST_ITEMS_QUERY, (list_id,))
 
-            items = []
-            for row in cursor.fetchall():
-                items.append({
-                    "id": str(row[0]),
-                    "zpid": row[1],
-                    "propertyType": row[2],
-                    "notes": row[3],
-                    "addedAt": row[4].isoformat()
-                })
+            items = [_list_item_to_dict(row) for row in cursor.fetchall()]
 
             list_data["items"] = items
             list_data["itemCount"] = len(items)
@@ -225,7 +291,7 @@ def get_list_with_items(list_id):
         return jsonify({"error": "Failed to fetch list"}), 500
 
 
-@lists_bp.route("/<list_id>", methods=["PUT"])
+@lists_bp.route("/<uuid:list_id>", methods=["PUT"])
 @require_auth
 @limiter.limit("30 per hour")
 def update_list(list_id):
@@ -260,7 +326,7 @@ def update_list(list_id):
         if name is None and description is None:
             return jsonify({"error": "Provide name or description to update"}), 400
 
-        with get_db_connection() as conn:
+        with get_db_connection(statement_timeout=WRITE_STATEMENT_TIMEOUT) as conn:
             cursor = conn.cursor()
 
             # Build dynamic UPDATE query
@@ -277,26 +343,39 @@ def update_list(list_id):
 
             params.extend([list_id, g.user_id])
 
+            # Skip the update when another of the user's lists already has the
+            # name, and report the conflict in the same round trip
             cursor.execute(f"""
-                UPDATE user_property_lists
-                SET {', '.join(updates)}
-                WHERE id = %s AND user_id = %s
-                RETURNING id, name, description, created_at, updated_at
-            """, params)
+                WITH conflict AS (
+                    SELECT 1 FROM user_property_lists
+                    WHERE user_id = %s AND lower(name) = lower(%s) AND id <> %s
+                ), updated AS (
+                    UPDATE user_property_lists
+                    SET {', '.join(updates)}
+                    WHERE id = %s AND user_id = %s
+                    AND NOT EXISTS (SELECT 1 FROM conflict)
+                    RETURNING id, name, description, created_at, updated_at
+                )
+                SELECT EXISTS (SELECT 1 FROM conflict), updated.*
+                FROM (SELECT 1) AS one LEFT JOIN updated ON TRUE
+            """, [g.user_id, name, list_id] + params)
 
-            result = cursor.fetchone()
+            conflict, *result = cursor.fetchone()
 
-            if not result:
+            if conflict:
+                return jsonify({"error": "A list with this name already exists"}), 409
+
+            if result[0] is None:
                 return jsonify({"error": "List not found"}), 404
 
             logger.info(f"List updated: {list_id} for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "name": result[1],
                 "description": result[2],
-                "createdAt": result[3].isoformat(),
-                "updatedAt": result[4].isoformat()
+                "createdAt": result[3],
+                "updatedAt": result[4]
             }), 200
 
     except psycopg2.errors.UniqueViolation:
@@ -306,7 +385,7 @@ def update_list(list_id):
         return jsonify({"error": "Failed to update list"}), 500
 
 
-@lists_bp.route("/<list_id>", methods=["DELETE"])
+@lists_bp.route("/<uuid:list_id>", methods=["DELETE"])
 @require_auth
 @limiter.limit("20 per hour")
 def delete_list(list_id):
@@ -319,7 +398,7 @@ def delete_list(list_id):
         500: Server error
     """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(statement_timeout=WRITE_STATEMENT_TIMEOUT) as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -342,7 +421,7 @@ def delete_list(list_id):
         return jsonify({"error": "Failed to delete list"}), 500
 
 
-@lists_bp.route("/<list_id>/items", methods=["POST"])
+@lists_bp.route("/<uuid:list_id>/items", methods=["POST"])
 @require_auth
 @limiter.limit("60 per minute")
 def add_property_to_list(list_id):
@@ -376,10 +455,10 @@ def add_property_to_list(list_id):
         if not zpid:
             return jsonify({"error": "zpid is required"}), 400
 
-        if property_type not in ["rental", "forsale"]:
+        if property_type not in ALLOWED_PROPERTY_TYPES:
             return jsonify({"error": "propertyType must be 'rental' or 'forsale'"}), 400
 
-        with get_db_connection() as conn:
+        with get_db_connection(statement_timeout=WRITE_STATEMENT_TIMEOUT) as conn:
             cursor = conn.cursor()
 
             # Verify list ownership
@@ -403,12 +482,12 @@ def add_property_to_list(list_id):
             logger.info(f"Property {zpid} added to list {list_id} for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "listId": list_id,
                 "zpid": result[1],
                 "propertyType": result[2],
                 "notes": result[3],
-                "addedAt": result[4].isoformat()
+                "addedAt": result[4]
             }), 201
 
     except psycopg2.errors.UniqueViolation:
@@ -418,7 +497,7 @@ def add_property_to_list(list_id):
         return jsonify({"error": "Failed to add property"}), 500
 
 
-@lists_bp.route("/<list_id>/items/<item_id>", methods=["DELETE"])
+@lists_bp.route("/<uuid:list_id>/items/<uuid:item_id>", methods=["DELETE"])
 @require_auth
 @limiter.limit("60 per minute")
 def remove_property_from_list(list_id, item_id):
@@ -431,7 +510,7 @@ def remove_property_from_list(list_id, item_id):
         500: Server error
     """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(statement_timeout=WRITE_STATEMENT_TIMEOUT) as conn:
             cursor = conn.cursor()
 
             # Verify ownership and delete
@@ -458,7 +537,7 @@ def remove_property_from_list(list_id, item_id):
         return jsonify({"error": "Failed to remove property"}), 500
 
 
-@lists_bp.route("/<list_id>/items/<item_id>", methods=["PUT"])
+@lists_bp.route("/<uuid:list_id>/items/<uuid:item_id>", methods=["PUT"])
 @require_auth
 @limiter.limit("30 per hour")
 def update_list_item(list_id, item_id):
@@ -484,7 +563,7 @@ def update_list_item(list_id, item_id):
 
         notes = data.get("notes", "").strip()
 
-        with get_db_connection() as conn:
+        with get_db_connection(statement_timeout=WRITE_STATEMENT_TIMEOUT) as conn:
             cursor = conn.cursor()
 
             # Verify ownership and update
@@ -506,11 +585,11 @@ def update_list_item(list_id, item_id):
             logger.info(f"Item {item_id} notes updated for user {g.user_id}")
 
             return jsonify({
-                "id": str(result[0]),
+                "id": result[0],
                 "zpid": result[1],
                 "propertyType": result[2],
                 "notes": result[3],
-                "addedAt": result[4].isoformat()
+                "addedAt": result[4]
             }), 200
 
     except Exception as e:
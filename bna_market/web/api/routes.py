@@ -7,62 +7,47 @@ Endpoints:
 - /api/metrics/fred - Get FRED economic metrics with optional filters
 """
 
-from flask import request, jsonify, make_response, current_app
+from flask import Response, request, jsonify, current_app, stream_with_context
+from contextlib import ExitStack
+from functools import lru_cache
 from io import StringIO
+from uuid import uuid4
+import base64
 import csv
+import json
+import threading
+import time
+import zlib
 
 from bna_market.web.api import api_bp
-from bna_market.web.app import limiter
-from bna_market.utils.database import get_db_connection
+from bna_market.web.app import gzip_body, limiter, set_gzip_body
+from bna_market.utils.database import get_db_connection, get_ro_connection
 from bna_market.utils.logger import setup_logger
 
-logger = setup_logger("api")
+logger = setup_logger("api", use_queue=True)
 
 
+@lru_cache(maxsize=256)
 def snake_to_camel(name: str) -> str:
-    """Convert snake_case to camelCase for JSON API responses"""
+    """Convert snake_case to camelCase for JSON API responses (memoized per column name)"""
     components = name.split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
-# Fields that should be numeric (not strings)
-NUMERIC_FIELDS = {
-    'price', 'bathrooms', 'living_area', 'latitude', 'longitude',
-    'price_per_sqft', 'bedrooms', 'days_on_zillow'
-}
-
-
-def convert_numerics(prop: dict) -> dict:
-    """Convert Decimal/string numeric values to proper Python floats/ints"""
-    from decimal import Decimal
-    result = {}
-    for k, v in prop.items():
-        if k in NUMERIC_FIELDS and v is not None:
-            if isinstance(v, Decimal):
-                # Convert Decimal to float or int
-                result[k] = float(v) if '.' in str(v) else int(v)
-            elif isinstance(v, str):
-                # Convert string numbers to float or int
-                try:
-                    result[k] = float(v) if '.' in v else int(v)
-                except (ValueError, TypeError):
-                    result[k] = v
-            else:
-                result[k] = v
-        else:
-            result[k] = v
-    return result
-
+def rows_to_properties(columns: list, rows) -> list:
+    """
+    Convert property rows to camelCase API dicts
 
-def transform_property(prop: dict) -> dict:
-    """Transform property dict: convert numerics and snake_case to camelCase"""
-    converted = convert_numerics(prop)
-    return {snake_to_camel(k): v for k, v in converted.items()}
+    Key names are converted once per result set. NUMERIC columns already
+    arrive as floats (see DEC2FLOAT in bna_market.utils.database).
+    """
+    keys = [snake_to_camel(c) for c in columns]
+    return [dict(zip(keys, row)) for row in rows]
 
 
 def get_app_db_connection():
-    """Get database connection (Supabase PostgreSQL)"""
-    return get_db_connection()
+    """Get read-only database connection (Supabase PostgreSQL) for the API endpoints"""
+    return get_db_connection(readonly=True)
 
 
 # Explicit table name mapping to prevent SQL injection (lowercase for PostgreSQL)
@@ -72,13 +57,348 @@ PROPERTY_TYPE_TABLE_MAP = {
 }
 
 
-def fix_zillow_url(detail_url):
-    """Fix Zillow URLs stored as relative paths"""
+# Sort key for search results; the trailing columns make it unique per row so
+# keyset pagination never skips or repeats rows that share a price
+SEARCH_ORDER_BY = "price DESC NULLS LAST, zpid DESC, snapshot_date DESC"
+
+
+# Short-lived cache of search COUNT(*) results keyed by (table, where clause, params)
+SEARCH_COUNT_TTL = 60
+SEARCH_COUNT_CACHE_SIZE = 1024
+_search_count_cache = {}
+
+
+def get_cached_search_count(key: tuple):
+    """Return a cached total for the filter key, or None if missing/expired"""
+    entry = _search_count_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, total = entry
+    if expires_at < time.monotonic():
+        _search_count_cache.pop(key, None)
+        return None
+    return total
+
+
+def cache_search_count(key: tuple, total: int) -> None:
+    """Store a filter total for SEARCH_COUNT_TTL seconds"""
+    if len(_search_count_cache) >= SEARCH_COUNT_CACHE_SIZE:
+        _search_count_cache.clear()
+    _search_count_cache[key] = (time.monotonic() + SEARCH_COUNT_TTL, total)
+
+
+@lru_cache(maxsize=256)
+def build_search_queries(table_name: str, where_clause: str, page_clause: str,
+                         use_offset: bool) -> tuple:
+    """
+    Build the (count_sql, data_sql) pair for one search filter shape
+
+    All values are bound as parameters, so the SQL depends only on which filters
+    are present and the paging mode; the number of distinct shapes is small and
+    the formatted statements are cached per shape.
+    """
+    count_sql = f"SELECT COUNT(*) FROM {table_name} WHERE {where_clause}"
+    limit_clause = "LIMIT %s OFFSET %s" if use_offset else "LIMIT %s"
+    data_sql = f"""
+        SELECT {PROPERTY_COLUMNS}, snapshot_date
+        FROM {table_name}
+        WHERE {where_clause} {page_clause}
+        ORDER BY {SEARCH_ORDER_BY}
+        {limit_clause}
+    """
+    return count_sql, data_sql
+
+
+def encode_search_cursor(price, zpid, snapshot_date) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    key = [
+        None if price is None else str(price),
+        str(zpid),
+        None if snapshot_date is None else str(snapshot_date),
+    ]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_search_cursor(token: str) -> list:
+    """
+    Decode a cursor produced by encode_search_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("invalid cursor") from e
+    if not isinstance(key, list) or len(key) != 3:
+        raise ValueError("invalid cursor")
+    # Elements become query parameters; nested lists/objects would be adapted
+    # to arrays or fail inside psycopg2
+    if any(isinstance(part, bool) or not isinstance(part, (str, int, float, type(None)))
+           for part in key):
+        raise ValueError("invalid cursor")
+    return key
+
+
+def keyset_condition(key: list) -> tuple:
+    """
+    Build the WHERE condition selecting rows after a cursor key in SEARCH_ORDER_BY order
+
+    Returns:
+        Tuple of (SQL condition, params)
+    """
+    price, zpid, snapshot_date = key
+    if price is None:
+        # Already into the NULL-price tail
+        return "(price IS NULL AND (zpid, snapshot_date) < (%s, %s))", [zpid, snapshot_date]
+    return (
+        "((price, zpid, snapshot_date) < (%s, %s, %s) OR price IS NULL)",
+        [price, zpid, snapshot_date],
+    )
+
+
+# FRED series shown as dashboard KPIs (metric_name -> response key)
+FRED_KPI_METRICS = {
+    'median_listing_price_change': 'medianPrice',
+    'active_listings': 'activeListings',
+    'median_dom': 'medianDaysOnMarket',
+    'msa_per_capita_income': 'perCapitaIncome'
+}
+
+# Market data tables written by the pipelines (read-only from the API)
+MARKET_DATA_TABLES = ("bna_rentals", "bna_forsale", "bna_fred_metrics")
+
+# Seconds clients may reuse dashboard/FRED responses before revalidating
+RESPONSE_MAX_AGE = 30
+
+
+# Seconds a data version is trusted before Postgres is asked again
+DATA_VERSION_TTL = 5
+_data_versions = {}
+
+
+def get_data_version(tables: tuple) -> str:
+    """
+    Return a version token that changes whenever any of the tables is written
+
+    Uses the cumulative insert/update/delete counters Postgres keeps per table,
+    which is far cheaper than re-running the endpoint queries. The token is
+    reused for DATA_VERSION_TTL seconds, so warm requests need no connection.
+
+    Args:
+        tables: Table names to include
+
+    Returns:
+        Version string suitable for use in an ETag
+    """
+    entry = _data_versions.get(tables)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    with get_app_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COALESCE(SUM(n_tup_ins + n_tup_upd + n_tup_del), 0)
+            FROM pg_stat_user_tables
+            WHERE relname = ANY(%s)
+        """, (list(tables),))
+        row = cursor.fetchone()
+
+    version = str(row[0]) if row else "0"
+    _data_versions[tables] = (time.monotonic() + DATA_VERSION_TTL, version)
+    return version
+
+
+# Serialized JSON bodies for /dashboard and /metrics/fred, keyed by path and
+# query args and tagged with the ETag (data version) they were built for. The
+# gzipped body is kept alongside so cache hits are not recompressed.
+RESPONSE_CACHE_SIZE = 256
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
+
+def response_cache_key() -> tuple:
+    """Cache key for the current request: path plus sorted query args"""
+    return (request.path, tuple(sorted(request.args.items(multi=True))))
+
+
+def get_cached_response(etag: str):
+    """Return the cached response for this request if built for this ETag, else None"""
+    with _response_cache_lock:
+        entry = _response_cache.get(response_cache_key())
+    if entry is None or entry[0] != etag:
+        return None
+
+    _, body, compressed = entry
+    response = current_app.response_class(body, mimetype="application/json")
+    response.headers["X-Cache"] = "HIT"
+    set_cache_validators(response, etag)
+    return set_gzip_body(response, compressed)
+
+
+def cache_response(etag: str, response: Response) -> Response:
+    """Store a JSON response body and its gzipped form for this request, then attach validators"""
+    body = response.get_data()
+    compressed = gzip_body(body)
+    with _response_cache_lock:
+        if len(_response_cache) >= RESPONSE_CACHE_SIZE:
+            _response_cache.clear()
+        _response_cache[response_cache_key()] = (etag, body, compressed)
+    set_cache_validators(response, etag)
+    return set_gzip_body(response, compressed)
+
+
+def set_cache_validators(response: Response, etag: str) -> Response:
+    """Attach the ETag and a short private Cache-Control to a response"""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.max_age = RESPONSE_MAX_AGE
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a matching If-None-Match"""
+    return set_cache_validators(current_app.response_class(status=304), etag)
+
+
+# Rows fetched per round trip when streaming CSV exports
+EXPORT_BATCH_SIZE = 1000
+
+# Largest export served; bigger result sets must be narrowed with filters
+MAX_EXPORT_ROWS = 200000
+
+# gzip level for exports: level 1 gets most of the size win for little CPU
+EXPORT_GZIP_LEVEL = 1
+
+# Filters shared by search and export: (query param, SQL condition, value caster)
+SEARCH_FILTERS = (
+    ("min_price", "price >= %s", float),
+    ("max_price", "price <= %s", float),
+    ("min_beds", "bedrooms >= %s", int),
+    ("max_beds", "bedrooms <= %s", int),
+    ("min_baths", "bathrooms >= %s", float),
+    ("max_baths", "bathrooms <= %s", float),
+    ("min_sqft", "living_area >= %s", int),
+    ("max_sqft", "living_area <= %s", int),
+    # City: partial match, case-insensitive
+    ("city", "LOWER(address) LIKE %s", lambda v: f"%{v.lower()}%"),
+    # ZIP code: matched within the address
+    ("zip_code", "address LIKE %s", lambda v: f"%{v}%"),
+)
+
+
+# Filters for /metrics/fred (values are passed through as strings)
+FRED_FILTERS = (
+    ("metric_name", "metric_name = %s", str),
+    ("series_id", "series_id = %s", str),
+    ("start_date", "date >= %s", str),
+    ("end_date", "date <= %s", str),
+)
+
+
+def build_filter_conditions(args, filters: tuple = SEARCH_FILTERS) -> tuple:
+    """
+    Build the WHERE clause and params for a table of query-param filters
+
+    Each param is looked up once; empty values are ignored.
+
+    Args:
+        args: Request query args
+        filters: (param, condition, caster) tuples
+
+    Returns:
+        Tuple of (where_clause, params)
+
+    Raises:
+        ValueError: If a numeric filter cannot be parsed
+    """
+    conditions = []
+    params = []
+    for name, condition, cast in filters:
+        value = args.get(name)
+        if value:
+            conditions.append(condition)
+            params.append(cast(value))
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    return where_clause, params
+
+
+# Absolute Zillow URL, derived in SQL with the same rules as fix_zillow_url
+DETAIL_URL_SQL = """
+    CASE
+        WHEN detail_url IS NULL OR detail_url = '' THEN NULL
+        WHEN detail_url LIKE 'http%%' THEN detail_url
+        ELSE 'https://www.zillow.com' || detail_url
+    END AS detail_url"""
+
+# Property columns returned by the dashboard and search endpoints.
+# detail_url and price_per_sqft (price / living_area rounded to cents) are
+# derived in SQL so rows need no per-row fix-ups.
+PROPERTY_COLUMNS = f"""
+    zpid, address, price, bedrooms, bathrooms, living_area,
+    property_type, latitude, longitude, img_src,{DETAIL_URL_SQL},
+    days_on_zillow, listing_status,
+    CASE
+        WHEN price <> 0 AND living_area > 0
+        THEN ROUND(price::numeric / living_area, 2)
+    END AS price_per_sqft
+"""
+
+
+ZILLOW_BASE_URL = "https://www.zillow.com"
+
+
+def fix_zillow_url(detail_url, _base=ZILLOW_BASE_URL):
+    """Fix Zillow URLs stored as relative paths (hot routes do this in SQL via DETAIL_URL_SQL)"""
     if not detail_url:
         return None
-    if detail_url.startswith("http"):
-        return detail_url
-    return f"https://www.zillow.com{detail_url}"
+    return detail_url if detail_url.startswith("http") else _base + detail_url
+
+
+# Rows fetched per round trip by the dashboard listings cursor
+DASHBOARD_ITERSIZE = 1000
+
+# Listings returned per property type by /dashboard (override with the
+# DASHBOARD_ROW_CAP app config key); KPI totals still cover every row
+DASHBOARD_ROW_CAP = 1000
+
+# Both property types in one round trip, tagged by source. KPIs come from a
+# separate aggregate per table (a CTE evaluated once), so each listing branch
+# can walk the price index and stop at its LIMIT instead of scanning the whole
+# table for window aggregates. NULLS LAST keeps unpriced listings from filling
+# the row cap.
+DASHBOARD_LISTINGS_SQL = f"""
+    WITH rental_kpis AS (
+        SELECT COUNT(*) AS kpi_count, AVG(price) AS kpi_avg
+        FROM bna_rentals WHERE price > 0
+    ), forsale_kpis AS (
+        SELECT COUNT(*) AS kpi_count, AVG(price) AS kpi_avg
+        FROM bna_forsale WHERE price > 0
+    )
+    (SELECT 'rentals' AS source,
+            (SELECT kpi_count FROM rental_kpis) AS kpi_count,
+            (SELECT kpi_avg FROM rental_kpis) AS kpi_avg,
+            {PROPERTY_COLUMNS}
+     FROM bna_rentals
+     ORDER BY price DESC NULLS LAST
+     LIMIT %s)
+    UNION ALL
+    (SELECT 'forsale' AS source,
+            (SELECT kpi_count FROM forsale_kpis) AS kpi_count,
+            (SELECT kpi_avg FROM forsale_kpis) AS kpi_avg,
+            {PROPERTY_COLUMNS}
+     FROM bna_forsale
+     ORDER BY price DESC NULLS LAST
+     LIMIT %s)
+    ORDER BY source, price DESC NULLS LAST
+"""
+
+DASHBOARD_FRED_SQL = """
+    SELECT date, metric_name as "metricName", series_id as "seriesId", value
+    FROM bna_fred_metrics
+    ORDER BY date DESC
+"""
 
 
 @api_bp.route("/dashboard", methods=["GET"])
@@ -91,99 +411,53 @@ def get_dashboard():
         JSON with propertyKPIs, fredKPIs, rentals, forsale, fredMetrics, lastUpdated
     """
     try:
-        with get_app_db_connection() as conn:
-            cursor = conn.cursor()
+        # Repeat polls skip the queries below until the market data changes
+        etag = f"{get_data_version(MARKET_DATA_TABLES)}-dashboard"
+        if request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
 
-            # Get KPI aggregates from FULL database
-            cursor.execute("""
-                SELECT COUNT(*) as count, AVG(price) as avg_price
-                FROM bna_rentals
-                WHERE price IS NOT NULL AND price > 0
-            """)
-            rental_stats = cursor.fetchone()
-            rental_count = rental_stats[0] if rental_stats else 0
-            rental_avg = round(rental_stats[1]) if rental_stats and rental_stats[1] else None
-
-            cursor.execute("""
-                SELECT COUNT(*) as count, AVG(price) as avg_price
-                FROM bna_forsale
-                WHERE price IS NOT NULL AND price > 0
-            """)
-            forsale_stats = cursor.fetchone()
-            forsale_count = forsale_stats[0] if forsale_stats else 0
-            forsale_avg = round(forsale_stats[1]) if forsale_stats and forsale_stats[1] else None
+        # Unchanged data: reuse the payload serialized by an earlier request
+        cached = get_cached_response(etag)
+        if cached is not None:
+            return cached
 
-            # Get rental properties
-            cursor.execute("""
-                SELECT zpid, address, price, bedrooms, bathrooms, living_area,
-                       property_type, latitude, longitude, img_src, detail_url,
-                       days_on_zillow, listing_status
-                FROM bna_rentals
-                ORDER BY price DESC
-            """)
-            columns = [desc[0] for desc in cursor.description]
-            rentals = []
-            for row in cursor.fetchall():
-                prop = dict(zip(columns, row))
-                prop['detail_url'] = fix_zillow_url(prop.get('detail_url'))
-                if prop.get('price') and prop.get('living_area') and prop['living_area'] > 0:
-                    prop['price_per_sqft'] = round(prop['price'] / prop['living_area'], 2)
-                else:
-                    prop['price_per_sqft'] = None
-                rentals.append(transform_property(prop))
-
-            # Get for-sale properties
-            cursor.execute("""
-                SELECT zpid, address, price, bedrooms, bathrooms, living_area,
-                       property_type, latitude, longitude, img_src, detail_url,
-                       days_on_zillow, listing_status
-                FROM bna_forsale
-                ORDER BY price DESC
-            """)
-            columns = [desc[0] for desc in cursor.description]
-            forsale = []
-            for row in cursor.fetchall():
-                prop = dict(zip(columns, row))
-                prop['detail_url'] = fix_zillow_url(prop.get('detail_url'))
-                if prop.get('price') and prop.get('living_area') and prop['living_area'] > 0:
-                    prop['price_per_sqft'] = round(prop['price'] / prop['living_area'], 2)
-                else:
-                    prop['price_per_sqft'] = None
-                forsale.append(transform_property(prop))
-
-            # Get FRED metrics
-            cursor.execute("""
-                SELECT date, metric_name as "metricName", series_id as "seriesId", value
-                FROM bna_fred_metrics
-                ORDER BY date DESC
-            """)
+        with get_app_db_connection() as conn:
+            # Server-side cursor: rows arrive in DASHBOARD_ITERSIZE batches instead of
+            # the whole result being buffered client-side first
+            cursor = conn.cursor(name=f"dashboard_{uuid4().hex}")
+            cursor.itersize = DASHBOARD_ITERSIZE
+
+            row_cap = current_app.config.get("DASHBOARD_ROW_CAP", DASHBOARD_ROW_CAP)
+            cursor.execute(DASHBOARD_LISTINGS_SQL, (row_cap, row_cap))
+            listings = {"rentals": [], "forsale": []}
+            kpis = {"rentals": (0, None), "forsale": (0, None)}
+            for row in cursor:
+                source = row[0]
+                if not listings[source]:
+                    kpis[source] = (row[1], round(row[2]) if row[2] else None)
+                listings[source].append(row[3:])
+            # Named cursors only have a description once rows have been fetched
+            columns = [desc[0] for desc in cursor.description][3:] if cursor.description else []
+            cursor.close()
+            rentals = rows_to_properties(columns, listings["rentals"])
+            forsale = rows_to_properties(columns, listings["forsale"])
+
+            # Get FRED metrics (small, so a client-side cursor)
+            cursor = conn.cursor()
+            cursor.execute(DASHBOARD_FRED_SQL)
+            # Dates serialize as ISO strings (Chart.js compatible) via the JSON provider
             columns = [desc[0] for desc in cursor.description]
-            fred_metrics = []
-            for row in cursor.fetchall():
-                metric = dict(zip(columns, row))
-                # Convert date to ISO format for Chart.js compatibility
-                if metric.get('date') and hasattr(metric['date'], 'isoformat'):
-                    metric['date'] = metric['date'].isoformat()
-                fred_metrics.append(metric)
-
-            # Calculate FRED KPIs (latest values)
-            fred_kpis = {}
-            metric_map = {
-                'median_listing_price_change': 'medianPrice',
-                'active_listings': 'activeListings',
-                'median_dom': 'medianDaysOnMarket',
-                'msa_per_capita_income': 'perCapitaIncome'
-            }
+            fred_metrics = [dict(zip(columns, row)) for row in cursor]
 
-            latest_by_metric = {}
-            for metric in fred_metrics:
-                name = metric.get('metricName')
-                if name not in latest_by_metric:
-                    latest_by_metric[name] = metric
+        rental_count, rental_avg = kpis["rentals"]
+        forsale_count, forsale_avg = kpis["forsale"]
 
-            for db_name, kpi_name in metric_map.items():
-                if db_name in latest_by_metric:
-                    fred_kpis[kpi_name] = latest_by_metric[db_name].get('value')
+        # Latest value per KPI series (fred_metrics is newest first)
+        fred_kpis = {}
+        for metric in fred_metrics:
+            key = FRED_KPI_METRICS.get(metric["metricName"])
+            if key and key not in fred_kpis:
+                fred_kpis[key] = metric["value"]
 
         from datetime import datetime
 
@@ -191,7 +465,7 @@ def get_dashboard():
         # Use current time as a placeholder or query for latest update
         last_updated = datetime.utcnow().isoformat() + "Z"
 
-        return jsonify({
+        response = jsonify({
             "propertyKPIs": {
                 "totalRentalListings": rental_count,
                 "avgRentalPrice": rental_avg,
@@ -204,6 +478,7 @@ def get_dashboard():
             "fredMetrics": fred_metrics,
             "lastUpdated": last_updated
         })
+        return cache_response(etag, response)
 
     except Exception as e:
         logger.error(f"Dashboard error: {e}")
@@ -228,7 +503,9 @@ def search_properties():
         max_sqft (int): Maximum square footage
         city (str): City name (partial match)
         zip_code (str): ZIP code (exact match)
-        page (int): Page number (default: 1)
+        cursor (str): nextCursor from the previous page (preferred over page)
+        include_total (int): With cursor, set to 1 to also return totalCount/totalPages
+        page (int): Page number (default: 1, deprecated in favour of cursor)
         per_page (int): Items per page (default: 20, max: 100)
 
     Returns:
@@ -248,91 +525,58 @@ def search_properties():
         per_page = min(100, max(1, int(request.args.get("per_page", 20))))
         offset = (page - 1) * per_page
 
-        # Build WHERE clause with filters (PostgreSQL uses %s placeholders)
-        conditions = []
-        params = []
-
-        # Price filters
-        if request.args.get("min_price"):
-            conditions.append("price >= %s")
-            params.append(float(request.args.get("min_price")))
-        if request.args.get("max_price"):
-            conditions.append("price <= %s")
-            params.append(float(request.args.get("max_price")))
-
-        # Bedroom filters
-        if request.args.get("min_beds"):
-            conditions.append("bedrooms >= %s")
-            params.append(int(request.args.get("min_beds")))
-        if request.args.get("max_beds"):
-            conditions.append("bedrooms <= %s")
-            params.append(int(request.args.get("max_beds")))
-
-        # Bathroom filters
-        if request.args.get("min_baths"):
-            conditions.append("bathrooms >= %s")
-            params.append(float(request.args.get("min_baths")))
-        if request.args.get("max_baths"):
-            conditions.append("bathrooms <= %s")
-            params.append(float(request.args.get("max_baths")))
-
-        # Square footage filters
-        if request.args.get("min_sqft"):
-            conditions.append('living_area >= %s')
-            params.append(int(request.args.get("min_sqft")))
-        if request.args.get("max_sqft"):
-            conditions.append('living_area <= %s')
-            params.append(int(request.args.get("max_sqft")))
-
-        # City filter (partial match, case-insensitive)
-        if request.args.get("city"):
-            conditions.append("LOWER(address) LIKE %s")
-            params.append(f'%{request.args.get("city").lower()}%')
-
-        # ZIP code filter (exact match)
-        if request.args.get("zip_code"):
-            conditions.append("address LIKE %s")
-            params.append(f'%{request.args.get("zip_code")}%')
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        # Keyset cursor: seek past the last row instead of scanning OFFSET rows
+        cursor_token = request.args.get("cursor")
+        cursor_key = decode_search_cursor(cursor_token) if cursor_token else None
+
+        where_clause, params = build_filter_conditions(request.args)
+
+        # Paging: seek past the cursor key, or fall back to OFFSET.
+        # One extra row tells us whether there's a next page.
+        if cursor_key:
+            keyset_sql, keyset_params = keyset_condition(cursor_key)
+            page_clause = f"AND {keyset_sql}"
+            page_params = keyset_params + [per_page + 1]
+        else:
+            page_clause = ""
+            page_params = [per_page + 1, offset]
+
+        count_query, data_query = build_search_queries(
+            table_name, where_clause, page_clause, cursor_key is None
+        )
 
         # Execute queries with database connection
         with get_app_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Get total count
-            count_query = f"SELECT COUNT(*) FROM {table_name} WHERE {where_clause}"
-            cursor.execute(count_query, params)
-            total_count = cursor.fetchone()[0]
-
-            # Get paginated results
-            data_query = f"""
-                SELECT zpid, address, price, bedrooms, bathrooms, living_area,
-                       property_type, latitude, longitude, img_src, detail_url,
-                       days_on_zillow, listing_status
-                FROM {table_name}
-                WHERE {where_clause}
-                ORDER BY price DESC
-                LIMIT %s OFFSET %s
-            """
-            cursor.execute(data_query, params + [per_page, offset])
+            # Get total count: cursor pages skip it unless asked, and totals for
+            # the same filters are reused for SEARCH_COUNT_TTL seconds
+            total_count = None
+            if not cursor_key or request.args.get("include_total") == "1":
+                count_key = (table_name, where_clause, tuple(params))
+                total_count = get_cached_search_count(count_key)
+                if total_count is None:
+                    cursor.execute(count_query, params)
+                    total_count = cursor.fetchone()[0]
+                    cache_search_count(count_key, total_count)
+
+            cursor.execute(data_query, params + page_params)
 
             # Fetch results and convert to list of dicts
             columns = [desc[0] for desc in cursor.description]
-            properties = []
-            for row in cursor.fetchall():
-                prop = dict(zip(columns, row))
-                # Fix Zillow URL
-                prop['detail_url'] = fix_zillow_url(prop.get('detail_url'))
-                # Calculate price per square foot
-                if prop.get('price') and prop.get('living_area') and prop['living_area'] > 0:
-                    prop['price_per_sqft'] = round(prop['price'] / prop['living_area'], 2)
-                else:
-                    prop['price_per_sqft'] = None
-                properties.append(transform_property(prop))
+            rows = cursor.fetchall()
+            has_more = len(rows) > per_page
+            # snapshot_date (last column) is only used to build the cursor
+            properties = rows_to_properties(columns[:-1], rows[:per_page])
+
+        # Cursor for the next page is the sort key of the last row returned
+        next_cursor = None
+        if has_more:
+            last = dict(zip(columns, rows[per_page - 1]))
+            next_cursor = encode_search_cursor(last['price'], last['zpid'], last['snapshot_date'])
 
         # Calculate pagination metadata
-        total_pages = (total_count + per_page - 1) // per_page
+        total_pages = None if total_count is None else (total_count + per_page - 1) // per_page
 
         logger.info(
             f"Search executed: {property_type}, page {page}, found {total_count} total results"
@@ -346,20 +590,37 @@ def search_properties():
                     "perPage": per_page,
                     "totalCount": total_count,
                     "totalPages": total_pages,
-                    "hasNext": page < total_pages,
+                    "hasNext": has_more if cursor_key else page < total_pages,
                     "hasPrev": page > 1,
+                    "nextCursor": next_cursor,
                 },
             }
         )
 
     except ValueError as e:
-        logger.error(f"Invalid parameter value: {e}")
+        logger.warning(f"Invalid parameter value: {e}")
         return jsonify({"error": f"Invalid parameter value: {str(e)}"}), 400
     except Exception as e:
         logger.error(f"Search error: {e}")
         return jsonify({"error": "Internal server error"}), 500
 
 
+@lru_cache(maxsize=256)
+def build_export_queries(table_name: str, where_clause: str) -> tuple:
+    """Build the (count_sql, select_sql) pair for one export filter shape, cached per shape"""
+    count_sql = f"SELECT COUNT(*) FROM {table_name} WHERE {where_clause}"
+    select_sql = f"""
+        SELECT zpid, address, price, bedrooms, bathrooms, living_area,
+               property_type, latitude, longitude, days_on_zillow,
+               listing_status, {DETAIL_URL_SQL}
+        FROM {table_name}
+        WHERE {where_clause}
+        ORDER BY price DESC NULLS LAST
+        LIMIT %s
+    """
+    return count_sql, select_sql
+
+
 @api_bp.route("/properties/export", methods=["GET"])
 @limiter.limit("10 per minute")
 def export_properties():
@@ -371,7 +632,8 @@ def export_properties():
         property_type (str): 'forsale' or 'rental' (required)
 
     Returns:
-        CSV file download with filtered properties
+        CSV file download with filtered properties (gzip-encoded when the client
+        accepts it), or 413 if more than MAX_EXPORT_ROWS properties match
     """
     try:
         # Validate required parameter
@@ -382,93 +644,89 @@ def export_properties():
         # Get table name from secure mapping
         table_name = PROPERTY_TYPE_TABLE_MAP[property_type]
 
-        # Build WHERE clause with same filters as search (PostgreSQL %s placeholders)
-        conditions = []
-        params = []
-
-        # Price filters
-        if request.args.get("min_price"):
-            conditions.append("price >= %s")
-            params.append(float(request.args.get("min_price")))
-        if request.args.get("max_price"):
-            conditions.append("price <= %s")
-            params.append(float(request.args.get("max_price")))
-
-        # Bedroom filters
-        if request.args.get("min_beds"):
-            conditions.append("bedrooms >= %s")
-            params.append(int(request.args.get("min_beds")))
-        if request.args.get("max_beds"):
-            conditions.append("bedrooms <= %s")
-            params.append(int(request.args.get("max_beds")))
-
-        # Bathroom filters
-        if request.args.get("min_baths"):
-            conditions.append("bathrooms >= %s")
-            params.append(float(request.args.get("min_baths")))
-        if request.args.get("max_baths"):
-            conditions.append("bathrooms <= %s")
-            params.append(float(request.args.get("max_baths")))
-
-        # Square footage filters
-        if request.args.get("min_sqft"):
-            conditions.append('living_area >= %s')
-            params.append(int(request.args.get("min_sqft")))
-        if request.args.get("max_sqft"):
-            conditions.append('living_area <= %s')
-            params.append(int(request.args.get("max_sqft")))
-
-        # City filter
-        if request.args.get("city"):
-            conditions.append("LOWER(address) LIKE %s")
-            params.append(f'%{request.args.get("city").lower()}%')
-
-        # ZIP code filter
-        if request.args.get("zip_code"):
-            conditions.append("address LIKE %s")
-            params.append(f'%{request.args.get("zip_code")}%')
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        # Execute query
-        with get_app_db_connection() as conn:
-            cursor = conn.cursor()
-
-            query = f"""
-                SELECT zpid, address, price, bedrooms, bathrooms, living_area,
-                       property_type, latitude, longitude, days_on_zillow,
-                       listing_status, detail_url
-                FROM {table_name}
-                WHERE {where_clause}
-                ORDER BY price DESC
-            """
-            cursor.execute(query, params)
-
-            # Create CSV in memory
-            output = StringIO()
+        where_clause, params = build_filter_conditions(request.args)
+
+        count_sql, query = build_export_queries(table_name, where_clause)
+
+        # Run the query and fetch the first batch up front so DB errors still
+        # produce a 500; the connection is then handed to the streaming generator
+        with ExitStack() as stack:
+            conn = stack.enter_context(get_app_db_connection())
+
+            # Refuse oversized exports before streaming starts (totals are shared
+            # with the search endpoint's count cache)
+            count_key = (table_name, where_clause, tuple(params))
+            total_count = get_cached_search_count(count_key)
+            if total_count is None:
+                count_cursor = conn.cursor()
+                count_cursor.execute(count_sql, params)
+                total_count = count_cursor.fetchone()[0]
+                cache_search_count(count_key, total_count)
+            if total_count > MAX_EXPORT_ROWS:
+                return jsonify({
+                    "error": (f"Export is limited to {MAX_EXPORT_ROWS} properties; "
+                              "narrow the filters"),
+                    "totalCount": total_count
+                }), 413
+
+            cursor = conn.cursor(name=f"export_{uuid4().hex}")
+            stack.callback(cursor.close)
+            cursor.itersize = EXPORT_BATCH_SIZE
+            cursor.execute(query, params + [MAX_EXPORT_ROWS])
+            first_batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
             columns = [desc[0] for desc in cursor.description]
-            writer = csv.writer(output)
-            writer.writerow(columns)
-            writer.writerows(cursor.fetchall())
-
-            # Prepare CSV response
-            csv_data = output.getvalue()
-            output.close()
-
-        response = make_response(csv_data)
-        response.headers["Content-Type"] = "text/csv"
-        response.headers["Content-Disposition"] = (
-            f"attachment; filename=bna_{property_type}_export.csv"
-        )
-
-        logger.info(
-            f"CSV export executed: {property_type}, {len(csv_data.splitlines()) - 1} properties"
-        )
-
+            conn_stack = stack.pop_all()
+
+        def generate():
+            """Yield the CSV one UTF-8 encoded batch of rows at a time"""
+            with conn_stack:
+                # csv.writer is the C implementation; quoting happens per batch in
+                # writerows() and each batch is encoded once before it is sent
+                output = StringIO()
+                writer = csv.writer(output)
+                writer.writerow(columns)
+
+                row_count = 0
+                batch = first_batch
+                while batch:
+                    writer.writerows(batch)
+                    row_count += len(batch)
+                    yield output.getvalue().encode("utf-8")
+                    output.seek(0)
+                    output.truncate(0)
+                    batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
+
+                if row_count == 0:
+                    yield output.getvalue().encode("utf-8")
+
+            logger.info(f"CSV export executed: {property_type}, {row_count} properties")
+
+        def generate_gzip():
+            """Compress the CSV stream chunk by chunk"""
+            compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            for chunk in generate():
+                data = compressor.compress(chunk)
+                if data:
+                    yield data
+            yield compressor.flush()
+
+        headers = {
+            "Content-Disposition": f"attachment; filename=bna_{property_type}_export.csv",
+            "Vary": "Accept-Encoding",
+        }
+        body = generate()
+        if "gzip" in request.accept_encodings:
+            headers["Content-Encoding"] = "gzip"
+            body = generate_gzip()
+
+        response = Response(stream_with_context(body), content_type="text/csv", headers=headers)
+        # Close the cursor and return the connection even if the client goes away
+        # before the generator starts
+        response.call_on_close(conn_stack.close)
         return response
 
     except ValueError as e:
-        logger.error(f"Invalid parameter value: {e}")
+        logger.warning(f"Invalid parameter value: {e}")
         return jsonify({"error": f"Invalid parameter value: {str(e)}"}), 400
     except Exception as e:
         logger.error(f"Export error: {e}")
@@ -491,29 +749,15 @@ def get_fred_metrics():
         JSON response with metrics array and count
     """
     try:
-        # Build WHERE clause with filters (PostgreSQL %s placeholders)
-        conditions = []
-        params = []
-
-        # Metric name filter
-        if request.args.get("metric_name"):
-            conditions.append("metric_name = %s")
-            params.append(request.args.get("metric_name"))
-
-        # Series ID filter
-        if request.args.get("series_id"):
-            conditions.append("series_id = %s")
-            params.append(request.args.get("series_id"))
-
-        # Date range filters
-        if request.args.get("start_date"):
-            conditions.append("date >= %s")
-            params.append(request.args.get("start_date"))
-        if request.args.get("end_date"):
-            conditions.append("date <= %s")
-            params.append(request.args.get("end_date"))
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause, params = build_filter_conditions(request.args, FRED_FILTERS)
+
+        etag = f"{get_data_version(('bna_fred_metrics',))}-fred"
+        if request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
+
+        cached = get_cached_response(etag)
+        if cached is not None:
+            return cached
 
         # Execute query
         with get_app_db_connection() as conn:
@@ -529,17 +773,12 @@ def get_fred_metrics():
 
             # Fetch results and convert to list of dicts
             columns = [desc[0] for desc in cursor.description]
-            metrics = []
-            for row in cursor.fetchall():
-                metric = dict(zip(columns, row))
-                # Convert date to string if it's a date object
-                if metric.get('date') and hasattr(metric['date'], 'isoformat'):
-                    metric['date'] = metric['date'].isoformat()
-                metrics.append(metric)
+            metrics = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
         logger.info(f"FRED metrics query executed, found {len(metrics)} records")
 
-        return jsonify({"metrics": metrics, "count": len(metrics)})
+        response = jsonify({"metrics": metrics, "count": len(metrics)})
+        return cache_response(etag, response)
 
     except Exception as e:
         logger.error(f"FRED metrics error: {e}")
@@ -566,6 +805,13 @@ def get_property_trends():
     try:
         months = min(int(request.args.get("months", 12)), 24)
 
+        # Trends are relative to CURRENT_DATE, so the day is part of the version
+        from datetime import date
+        version = get_data_version(('bna_rentals', 'bna_forsale'))
+        etag = f"{version}-{date.today().isoformat()}-trends"
+        if request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
+
         with get_app_db_connection() as conn:
             cursor = conn.cursor()
 
@@ -584,9 +830,9 @@ def get_property_trends():
             """, (months,))
 
             rental_trends = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 rental_trends.append({
-                    "month": row[0].isoformat() if row[0] else None,
+                    "month": row[0],
                     "avgPrice": int(row[1]) if row[1] else None,
                     "avgDom": float(row[2]) if row[2] else None,
                     "listingCount": int(row[3]) if row[3] else 0
@@ -607,9 +853,9 @@ def get_property_trends():
             """, (months,))
 
             sale_trends = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 sale_trends.append({
-                    "month": row[0].isoformat() if row[0] else None,
+                    "month": row[0],
                     "avgPrice": int(row[1]) if row[1] else None,
                     "avgDom": float(row[2]) if row[2] else None,
                     "listingCount": int(row[3]) if row[3] else 0
@@ -638,32 +884,61 @@ def get_property_trends():
 
         logger.info(f"Property trends query: {len(rental_trends)} rental months, {len(sale_trends)} sale months")
 
-        return jsonify({
+        response = jsonify({
             "rentalTrends": rental_trends,
             "saleTrends": sale_trends,
             "currentStats": {
                 "rental": {
                     "count": rental_current[0] if rental_current else 0,
-                    "avgPrice": int(rental_current[1]) if rental_current and rental_current[1] else None,
-                    "avgDom": float(rental_current[2]) if rental_current and rental_current[2] else None
+                    "avgPrice": (int(rental_current[1])
+                                 if rental_current and rental_current[1] else None),
+                    "avgDom": (float(rental_current[2])
+                               if rental_current and rental_current[2] else None)
                 },
                 "sale": {
                     "count": sale_current[0] if sale_current else 0,
-                    "avgPrice": int(sale_current[1]) if sale_current and sale_current[1] else None,
-                    "avgDom": float(sale_current[2]) if sale_current and sale_current[2] else None
+                    "avgPrice": (int(sale_current[1])
+                                 if sale_current and sale_current[1] else None),
+                    "avgDom": (float(sale_current[2])
+                               if sale_current and sale_current[2] else None)
                 }
             },
             "monthsRequested": months
         })
+        return set_cache_validators(response, etag)
 
     except ValueError as e:
-        logger.error(f"Invalid months parameter: {e}")
+        logger.warning(f"Invalid months parameter: {e}")
         return jsonify({"error": "Invalid months parameter"}), 400
     except Exception as e:
         logger.error(f"Property trends error: {e}")
         return jsonify({"error": "Internal server error"}), 500
 
 
+# Seconds a database health probe result is reused, so frequent uptime
+# monitors cost at most one probe per interval
+HEALTH_CHECK_TTL = 5
+_db_health = {"expires_at": 0.0, "status": "unknown", "error": None}
+
+
+def check_database_health() -> tuple:
+    """Return (db_status, db_error), probing the database at most once per HEALTH_CHECK_TTL"""
+    if _db_health["expires_at"] > time.monotonic():
+        return _db_health["status"], _db_health["error"]
+
+    try:
+        # Autocommit connection: a single SELECT round trip, no BEGIN/COMMIT
+        with get_ro_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+        status, error = "connected", None
+    except Exception as e:
+        status, error = "error", str(e)
+
+    _db_health.update(expires_at=time.monotonic() + HEALTH_CHECK_TTL, status=status, error=error)
+    return status, error
+
+
 @api_bp.route("/health", methods=["GET"])
 def health_check():
     """
@@ -672,17 +947,7 @@ def health_check():
     Returns:
         JSON response with API status
     """
-    # Test database connection
-    db_status = "unknown"
-    db_error = None
-    try:
-        with get_app_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            db_status = "connected"
-    except Exception as e:
-        db_status = "error"
-        db_error = str(e)
+    db_status, db_error = check_database_health()
 
     return jsonify(
         {
@@ -708,13 +973,13 @@ def auth_ping():
     return jsonify({"status": "ok", "message": "Auth endpoint works!", "location": "routes.py"}), 200
 
 
-@api_bp.route("/debug/blueprints", methods=["GET"])
-def debug_blueprints():
+@lru_cache(maxsize=1)
+def blueprint_import_report() -> dict:
     """
-    Debug endpoint to verify blueprint imports work in production
+    Try importing the auth, lists and searches blueprints and auth middleware
 
-    This endpoint tests if the auth, lists, and searches blueprints
-    can be imported successfully in the Vercel serverless environment.
+    Import results cannot change within a process, so the report is built on
+    first use and reused; callers must not mutate it.
     """
     import traceback
 
@@ -790,6 +1055,19 @@ def debug_blueprints():
         }
         results["status"] = "error"
 
+    return results
+
+
+@api_bp.route("/debug/blueprints", methods=["GET"])
+def debug_blueprints():
+    """
+    Debug endpoint to verify blueprint imports work in production
+
+    This endpoint tests if the auth, lists, and searches blueprints
+    can be imported successfully in the Vercel serverless environment.
+    """
+    results = dict(blueprint_import_report())
+
     # Check which blueprints are actually registered with Flask app
     try:
         registered_blueprints = list(current_app.blueprints.keys())
@@ -7,25 +7,157 @@ Filters are stored as JSONB (minPrice, maxPrice, minBeds, maxBeds, etc.)
 Endpoints:
 - GET /api/searches - Get all saved searches for current user
 - POST /api/searches - Save current search filters
+- POST /api/searches/bulk - Save several searches at once
 - GET /api/searches/<search_id> - Get single saved search
 - PUT /api/searches/<search_id> - Update saved search
 - DELETE /api/searches/<search_id> - Delete saved search
 """
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, jsonify, g, current_app
+from functools import lru_cache
 from bna_market.web.auth.middleware import require_auth
 from bna_market.web.app import limiter
 from bna_market.utils.database import get_db_connection
 from bna_market.utils.logger import setup_logger
+import hashlib
 import json
 import psycopg2.errors
+import psycopg2.extras
 
-logger = setup_logger("searches_api")
+logger = setup_logger("searches_api", use_queue=True)
 
 # Create searches blueprint
 searches_bp = Blueprint("searches", __name__, url_prefix="/api/searches")
 
 
+# Filter keys a saved search may store; anything else is dropped on save
+VALID_FILTER_KEYS = frozenset({
+    'minPrice', 'maxPrice', 'minBeds', 'maxBeds',
+    'minBaths', 'maxBaths', 'minSqft', 'maxSqft',
+    'city', 'zipCode'
+})
+
+# Most searches accepted by one POST /api/searches/bulk request
+MAX_BULK_SEARCHES = 50
+
+
+def make_etag(*parts) -> str:
+    """Short hash of the values that identify one version of a response"""
+    return hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+
+
+def set_revalidate_headers(response, etag: str):
+    """Attach the ETag and require browsers to revalidate (per-user data)"""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def etag_matches(etag: str) -> bool:
+    """
+    True if the client already holds this version (If-None-Match)
+
+    Gzipped copies carry a weak ETag, so the comparison is weak.
+    """
+    return request.if_none_match.contains_weak(etag)
+
+
+def not_modified(etag: str):
+    """Build an empty 304 response for a matching If-None-Match"""
+    return set_revalidate_headers(current_app.response_class(status=304), etag)
+
+
+def parse_new_search(data: dict) -> tuple:
+    """
+    Validate a new saved search from a request body
+
+    Returns:
+        ((name, property_type, filters), None) on success, or (None, error message)
+    """
+    name = data.get("name", "")
+    property_type = data.get("propertyType", "")
+    filters = data.get("filters", {})
+
+    if not isinstance(name, str):
+        return None, "Search name must be a string"
+
+    if not isinstance(property_type, str):
+        return None, "propertyType must be a string"
+
+    name = name.strip()
+    property_type = property_type.strip().lower()
+
+    if not name:
+        return None, "Search name is required"
+
+    if len(name) > 100:
+        return None, "Search name must be 100 characters or less"
+
+    if property_type not in ["rental", "forsale"]:
+        return None, "propertyType must be 'rental' or 'forsale'"
+
+    if not isinstance(filters, dict):
+        return None, "filters must be an object"
+
+    # Validate filter keys (optional - ensures only valid filters are saved)
+    invalid_keys = set(filters.keys()) - VALID_FILTER_KEYS
+    if invalid_keys:
+        logger.warning("Invalid filter keys: %s", invalid_keys)
+        # Remove invalid keys instead of rejecting
+        filters = {k: v for k, v in filters.items() if k in VALID_FILTER_KEYS}
+
+    return (name, property_type, filters), None
+
+
+def row_to_search(row) -> dict:
+    """
+    Convert an (id, name, property_type, filters, created_at, updated_at) row
+    to the API shape; the orjson provider serializes the UUID and timestamps
+    """
+    return {
+        "id": row[0],
+        "name": row[1],
+        "propertyType": row[2],
+        "filters": row[3],  # JSONB is already a dict
+        "createdAt": row[4],
+        "updatedAt": row[5],
+    }
+
+
+@lru_cache(maxsize=4)
+def build_update_search_sql(update_name: bool, update_filters: bool) -> str:
+    """
+    Build the UPDATE statement for one combination of supplied fields
+
+    Only three shapes exist (name, filters, or both), so each is formatted once
+    and reused. Server-side PREPARE is not an option here: the Supabase
+    transaction pooler may run EXECUTE on a different backend session.
+    """
+    updates = []
+    if update_name:
+        updates.append("name = %s")
+    if update_filters:
+        updates.append("filters = %s::jsonb")
+
+    # Skip the update when another of the user's searches already has the
+    # name, and report the conflict in the same round trip
+    return f"""
+        WITH conflict AS (
+            SELECT 1 FROM user_saved_searches
+            WHERE user_id = %s AND lower(name) = lower(%s) AND id <> %s
+        ), updated AS (
+            UPDATE user_saved_searches
+            SET {', '.join(updates)}
+            WHERE id = %s AND user_id = %s
+            AND NOT EXISTS (SELECT 1 FROM conflict)
+            RETURNING id, name, property_type, filters, created_at, updated_at
+        )
+        SELECT EXISTS (SELECT 1 FROM conflict), updated.*
+        FROM (SELECT 1) AS one LEFT JOIN updated ON TRUE
+    """
+
+
 @searches_bp.route("", methods=["GET"])
 @require_auth
 @limiter.limit("60 per minute")
@@ -54,6 +186,7 @@ def get_saved_searches():
                 }
             ]
         }
+        304: Unchanged since the ETag sent in If-None-Match
         401: Not authenticated
         500: Server error
     """
@@ -61,32 +194,38 @@ def get_saved_searches():
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
+            # Postgres builds the camelCase JSON array (ISO timestamps included), so
+            # the rows go straight into the response without per-row dicts
             cursor.execute("""
-                SELECT id, name, property_type, filters, created_at, updated_at
+                SELECT COALESCE(
+                    jsonb_agg(jsonb_build_object(
+                        'id', id,
+                        'name', name,
+                        'propertyType', property_type,
+                        'filters', filters,
+                        'createdAt', created_at,
+                        'updatedAt', updated_at
+                    ) ORDER BY updated_at DESC),
+                    '[]'::jsonb
+                )::text
                 FROM user_saved_searches
                 WHERE user_id = %s
-                ORDER BY updated_at DESC
             """, (g.user_id,))
 
-            columns = ['id', 'name', 'property_type', 'filters', 'created_at', 'updated_at']
-            searches = []
-            for row in cursor.fetchall():
-                search_data = dict(zip(columns, row))
-                searches.append({
-                    "id": str(search_data['id']),
-                    "name": search_data['name'],
-                    "propertyType": search_data['property_type'],
-                    "filters": search_data['filters'],  # JSONB is already a dict
-                    "createdAt": search_data['created_at'].isoformat() if search_data['created_at'] else None,
-                    "updatedAt": search_data['updated_at'].isoformat() if search_data['updated_at'] else None
-                })
+            searches_json = cursor.fetchone()[0]
 
-            logger.debug(f"Retrieved {len(searches)} saved searches for user {g.user_id}")
+            logger.debug("Retrieved saved searches for user %s", g.user_id)
 
-            return jsonify({"searches": searches}), 200
+            # The ETag hashes the body itself, so deletes change it too
+            body = f'{{"searches":{searches_json}}}'
+            etag = make_etag(g.user_id, body)
+            if etag_matches(etag):
+                return not_modified(etag)
+            response = current_app.response_class(body, status=200, mimetype="application/json")
+            return set_revalidate_headers(response, etag)
 
     except Exception as e:
-        logger.error(f"Get saved searches error: {e}", exc_info=True)
+        logger.error("Get saved searches error: %s", e, exc_info=True)
         return jsonify({"error": "Failed to fetch saved searches"}), 500
 
 
@@ -130,66 +269,105 @@ def save_search():
         if not data:
             return jsonify({"error": "Request body is required"}), 400
 
-        name = data.get("name", "").strip()
-        property_type = data.get("propertyType", "").strip().lower()
-        filters = data.get("filters", {})
-
-        if not name:
-            return jsonify({"error": "Search name is required"}), 400
-
-        if len(name) > 100:
-            return jsonify({"error": "Search name must be 100 characters or less"}), 400
-
-        if property_type not in ["rental", "forsale"]:
-            return jsonify({"error": "propertyType must be 'rental' or 'forsale'"}), 400
-
-        if not isinstance(filters, dict):
-            return jsonify({"error": "filters must be an object"}), 400
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be an object"}), 400
 
-        # Validate filter keys (optional - ensures only valid filters are saved)
-        valid_filter_keys = {
-            'minPrice', 'maxPrice', 'minBeds', 'maxBeds',
-            'minBaths', 'maxBaths', 'minSqft', 'maxSqft',
-            'city', 'zipCode'
-        }
-        invalid_keys = set(filters.keys()) - valid_filter_keys
-        if invalid_keys:
-            logger.warning(f"Invalid filter keys: {invalid_keys}")
-            # Remove invalid keys instead of rejecting
-            filters = {k: v for k, v in filters.items() if k in valid_filter_keys}
+        search, error = parse_new_search(data)
+        if error:
+            return jsonify({"error": error}), 400
+        name, property_type, filters = search
 
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Insert new saved search
+            # Insert new saved search; names are unique per user, case-insensitively
             cursor.execute("""
                 INSERT INTO user_saved_searches (user_id, name, property_type, filters)
                 VALUES (%s, %s, %s, %s::jsonb)
+                ON CONFLICT (user_id, lower(name)) DO NOTHING
                 RETURNING id, name, property_type, filters, created_at, updated_at
             """, (g.user_id, name, property_type, json.dumps(filters)))
 
             result = cursor.fetchone()
 
-            logger.info(f"Search saved: {result[0]} - '{result[1]}' for user {g.user_id}")
+            if not result:
+                logger.warning("Duplicate search name '%s' for user %s", name, g.user_id)
+                return jsonify({"error": "A search with this name already exists"}), 409
+
+            logger.info("Search saved: %s - '%s' for user %s", result[0], result[1], g.user_id)
+
+            return jsonify(row_to_search(result)), 201
+
+    except Exception as e:
+        logger.error("Save search error: %s", e, exc_info=True)
+        return jsonify({"error": "Failed to save search"}), 500
+
+
+@searches_bp.route("/bulk", methods=["POST"])
+@require_auth
+@limiter.limit("10 per hour")
+def save_searches_bulk():
+    """
+    Save several searches in one request (e.g. importing shared templates)
+
+    All rows are inserted with a single multi-row INSERT; searches whose name
+    the user already has are skipped rather than failing the whole batch.
+
+    Request Body:
+        [
+            {"name": "...", "propertyType": "rental", "filters": {...}},
+            ...
+        ]
+
+    Returns:
+        201: {"searches": [...created searches], "skipped": <count of existing names>}
+        400: Invalid data (not a list, too many searches, invalid search)
+        500: Server error
+    """
+    try:
+        data = request.get_json()
+
+        if not isinstance(data, list) or not data:
+            return jsonify({"error": "Request body must be a non-empty array of searches"}), 400
+
+        if len(data) > MAX_BULK_SEARCHES:
+            error = f"At most {MAX_BULK_SEARCHES} searches can be saved at once"
+            return jsonify({"error": error}), 400
+
+        rows = []
+        for index, item in enumerate(data):
+            if not isinstance(item, dict):
+                return jsonify({"error": f"Search {index} must be an object"}), 400
+            search, error = parse_new_search(item)
+            if error:
+                return jsonify({"error": f"Search {index}: {error}"}), 400
+            name, property_type, filters = search
+            rows.append((g.user_id, name, property_type, json.dumps(filters)))
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            results = psycopg2.extras.execute_values(cursor, """
+                INSERT INTO user_saved_searches (user_id, name, property_type, filters)
+                VALUES %s
+                ON CONFLICT (user_id, lower(name)) DO NOTHING
+                RETURNING id, name, property_type, filters, created_at, updated_at
+            """, rows, template="(%s, %s, %s, %s::jsonb)", page_size=MAX_BULK_SEARCHES, fetch=True)
+
+            logger.info("Bulk saved %d of %d searches for user %s",
+                        len(results), len(rows), g.user_id)
 
             return jsonify({
-                "id": str(result[0]),
-                "name": result[1],
-                "propertyType": result[2],
-                "filters": result[3],
-                "createdAt": result[4].isoformat(),
-                "updatedAt": result[5].isoformat()
+                "searches": [row_to_search(row) for row in results],
+                "skipped": len(rows) - len(results)
             }), 201
 
-    except psycopg2.errors.UniqueViolation:
-        logger.warning(f"Duplicate search name '{name}' for user {g.user_id}")
-        return jsonify({"error": "A search with this name already exists"}), 409
     except Exception as e:
-        logger.error(f"Save search error: {e}", exc_info=True)
-        return jsonify({"error": "Failed to save search"}), 500
+        logger.error("Bulk save searches error: %s", e, exc_info=True)
+        return jsonify({"error": "Failed to save searches"}), 500
 
 
-@searches_bp.route("/<search_id>", methods=["GET"])
+@searches_bp.route("/<uuid:search_id>", methods=["GET"])
 @require_auth
 @limiter.limit("60 per minute")
 def get_saved_search(search_id):
@@ -198,6 +376,7 @@ def get_saved_search(search_id):
 
     Returns:
         200: Saved search data
+        304: Unchanged since the ETag sent in If-None-Match
         404: Search not found or user doesn't own it
         500: Server error
     """
@@ -216,21 +395,19 @@ def get_saved_search(search_id):
             if not result:
                 return jsonify({"error": "Search not found"}), 404
 
-            return jsonify({
-                "id": str(result[0]),
-                "name": result[1],
-                "propertyType": result[2],
-                "filters": result[3],
-                "createdAt": result[4].isoformat(),
-                "updatedAt": result[5].isoformat()
-            }), 200
+            # Every write bumps updated_at (trigger), so it versions the row
+            etag = make_etag(result[0], result[5].isoformat())
+            if etag_matches(etag):
+                return not_modified(etag)
+
+            return set_revalidate_headers(jsonify(row_to_search(result)), etag), 200
 
     except Exception as e:
-        logger.error(f"Get saved search error: {e}", exc_info=True)
+        logger.error("Get saved search error: %s", e, exc_info=True)
         return jsonify({"error": "Failed to fetch search"}), 500
 
 
-@searches_bp.route("/<search_id>", methods=["PUT"])
+@searches_bp.route("/<uuid:search_id>", methods=["PUT"])
 @require_auth
 @limiter.limit("30 per hour")
 def update_saved_search(search_id):
@@ -271,51 +448,38 @@ def update_saved_search(search_id):
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Build dynamic UPDATE query
-            updates = []
             params = []
-
             if name is not None:
-                updates.append("name = %s")
                 params.append(name)
-
             if filters is not None:
-                updates.append("filters = %s::jsonb")
                 params.append(json.dumps(filters))
-
             params.extend([search_id, g.user_id])
 
-            cursor.execute(f"""
-                UPDATE user_saved_searches
-                SET {', '.join(updates)}
-                WHERE id = %s AND user_id = %s
-                RETURNING id, name, property_type, filters, created_at, updated_at
-            """, params)
+            cursor.execute(
+                build_update_search_sql(name is not None, filters is not None),
+                [g.user_id, name, search_id] + params
+            )
 
-            result = cursor.fetchone()
+            conflict, *result = cursor.fetchone()
 
-            if not result:
+            if conflict:
+                return jsonify({"error": "A search with this name already exists"}), 409
+
+            if result[0] is None:
                 return jsonify({"error": "Search not found"}), 404
 
-            logger.info(f"Search updated: {search_id} for user {g.user_id}")
+            logger.info("Search updated: %s for user %s", search_id, g.user_id)
 
-            return jsonify({
-                "id": str(result[0]),
-                "name": result[1],
-                "propertyType": result[2],
-                "filters": result[3],
-                "createdAt": result[4].isoformat(),
-                "updatedAt": result[5].isoformat()
-            }), 200
+            return jsonify(row_to_search(result)), 200
 
     except psycopg2.errors.UniqueViolation:
         return jsonify({"error": "A search with this name already exists"}), 409
     except Exception as e:
-        logger.error(f"Update search error: {e}", exc_info=True)
+        logger.error("Update search error: %s", e, exc_info=True)
         return jsonify({"error": "Failed to update search"}), 500
 
 
-@searches_bp.route("/<search_id>", methods=["DELETE"])
+@searches_bp.route("/<uuid:search_id>", methods=["DELETE"])
 @require_auth
 @limiter.limit("20 per hour")
 def delete_saved_search(search_id):
@@ -342,10 +506,10 @@ def delete_saved_search(search_id):
             if not result:
                 return jsonify({"error": "Search not found"}), 404
 
-            logger.info(f"Search deleted: {search_id} for user {g.user_id}")
+            logger.info("Search deleted: %s for user %s", search_id, g.user_id)
 
             return jsonify({"message": "Search deleted successfully"}), 200
 
     except Exception as e:
-        logger.error(f"Delete search error: {e}", exc_info=True)
+        logger.error("Delete search error: %s", e, exc_info=True)
         return jsonify({"error": "Failed to delete search"}), 500
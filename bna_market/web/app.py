@@ -5,24 +5,96 @@ The Vue SPA handles the frontend; this Flask app only serves the /api/* endpoint
 Database operations use Supabase PostgreSQL.
 """
 
+import gzip
 import os
-from flask import Flask
+import psycopg2.extras
+from flask import Flask, current_app, g, jsonify, request
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 from bna_market.utils.logger import setup_logger
+from bna_market.web.json_provider import OrjsonProvider
 
 logger = setup_logger("web_app")
 
+
+def rate_limit_key() -> str:
+    """Rate-limit authenticated requests per user and anonymous ones per client IP"""
+    user_id = g.get("user_id")
+    if user_id:
+        return f"user:{user_id}"
+    return get_remote_address()
+
+
 # Global limiter instance - configured per-app in create_app
+# Set RATELIMIT_STORAGE_URI=redis://... to share counters across instances
+# (memory:// counts per process, so N workers allow N times each limit).
+# The fixed-window strategy on Redis increments and sets the expiry in a single
+# Lua script call, so each limit check costs one round trip; set
+# RATELIMIT_STRATEGY=moving-window for exact sliding limits (sorted set per key).
+# Route limits run after @require_auth, so they are counted per user.
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=rate_limit_key,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",
+    storage_uri=os.getenv("RATELIMIT_STORAGE_URI", "memory://"),
+    strategy=os.getenv("RATELIMIT_STRATEGY", "fixed-window"),
 )
 
 
+# Buffered response types worth compressing (JSON bodies shrink 5-10x)
+COMPRESS_MIMETYPES = frozenset({"application/json", "text/html", "text/plain", "text/csv"})
+
+
+def gzip_body(data: bytes):
+    """gzip a response body with the app's settings, or None if it is under COMPRESS_MIN_SIZE"""
+    if len(data) < current_app.config["COMPRESS_MIN_SIZE"]:
+        return None
+    return gzip.compress(data, compresslevel=current_app.config["COMPRESS_LEVEL"], mtime=0)
+
+
+def set_gzip_body(response, compressed):
+    """
+    Send an already gzipped body to clients that accept it
+
+    The ETag is made weak: it then matches the identity encoding under weak
+    comparison (If-None-Match) without claiming the bytes are identical.
+    """
+    if compressed is None or "gzip" not in request.accept_encodings:
+        return response
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = "gzip"
+    etag, _ = response.get_etag()
+    if etag:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def compress_response(response):
+    """
+    gzip buffered text responses for clients that accept it
+
+    Streamed responses (CSV export) and responses that already carry a
+    Content-Encoding (including cached bodies compressed by the route) are
+    left alone; bodies under COMPRESS_MIN_SIZE bytes are not worth the CPU.
+    """
+    if response.mimetype not in COMPRESS_MIMETYPES:
+        return response
+    response.vary.add("Accept-Encoding")
+
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or not 200 <= response.status_code < 300
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.accept_encodings
+    ):
+        return response
+
+    return set_gzip_body(response, gzip_body(response.get_data()))
+
+
 def create_app(config=None):
     """
     Application factory for Flask app
@@ -35,15 +107,48 @@ def create_app(config=None):
     """
     app = Flask(__name__)
 
+    # Use orjson for jsonify/request.get_json (native UUID/datetime support)
+    app.json = OrjsonProvider(app)
+
+    # Match "/api/lists/" as well as "/api/lists" without a redirect round trip
+    app.url_map.strict_slashes = False
+
+    # Let psycopg2 adapt uuid.UUID values from <uuid:...> route converters
+    psycopg2.extras.register_uuid()
+
+    # Request bodies are small JSON documents (saved searches, lists, CRM
+    # records); cap them so oversized uploads are refused before parsing
+    app.config["MAX_CONTENT_LENGTH"] = 64 * 1024
+
+    # Response compression defaults (see compress_response)
+    app.config["COMPRESS_MIN_SIZE"] = 512
+    app.config["COMPRESS_LEVEL"] = 5
+
     # Override with custom config if provided
     if config:
         app.config.update(config)
 
+    app.after_request(compress_response)
+
+    # Refuse oversized bodies up front with a JSON 413; left to get_json(), the
+    # error would surface inside the handlers' generic 500 handling
+    @app.before_request
+    def reject_oversized_body():
+        limit = app.config.get("MAX_CONTENT_LENGTH")
+        if limit and request.content_length and request.content_length > limit:
+            return jsonify({"error": "Request body too large"}), 413
+
     # Enable CORS for the API endpoints
     # In production, Vercel handles CORS; this is for local development
     cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
     CORS(app, origins=cors_origins, supports_credentials=True)
 
+    # Behind Vercel's proxy every request arrives from the proxy address, so take
+    # the client IP from X-Forwarded-For (only trusted when a proxy is in front)
+    proxy_hops = int(os.getenv("TRUSTED_PROXY_HOPS", "1" if os.getenv("VERCEL") else "0"))
+    if proxy_hops:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxy_hops)
+
     # Initialize rate limiter
     # Skip rate limiting in test mode
     if not app.config.get("TESTING"):
@@ -62,6 +167,11 @@ def create_app(config=None):
     app.register_blueprint(searches_bp)
     app.register_blueprint(crm_bp)
 
+    # Routing misses (including malformed <uuid:...> ids) return JSON like the API handlers
+    @app.errorhandler(404)
+    def not_found(e):
+        return jsonify({"error": "Not found"}), 404
+
     logger.info("Flask app initialized with auth, lists, searches, and CRM blueprints")
 
     return app
@@ -13,6 +13,9 @@ Usage:
         return jsonify({"user_id": g.user_id})
 """
 
+import hashlib
+import threading
+import time
 from functools import wraps
 from flask import request, jsonify, g
 import jwt
@@ -21,6 +24,14 @@ from bna_market.utils.logger import setup_logger
 
 logger = setup_logger("auth_middleware")
 
+# Verified token payloads keyed by SHA-256 of the token, so repeat requests
+# with the same bearer token skip signature verification. Entries never
+# outlive the token's own exp claim.
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_SIZE = 10_000
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+
 
 def verify_token(token: str) -> dict:
     """
@@ -28,6 +39,8 @@ def verify_token(token: str) -> dict:
 
     Supabase signs JWTs with the project's JWT secret.
     The token contains user ID (sub), email, role, and expiration.
+    Verified payloads are cached for up to TOKEN_CACHE_TTL seconds
+    (never past exp); only successfully verified tokens are cached.
 
     Args:
         token: JWT token string from Authorization header
@@ -46,6 +59,13 @@ def verify_token(token: str) -> dict:
         logger.error("SUPABASE_JWT_SECRET not configured")
         raise jwt.InvalidTokenError("Server configuration error")
 
+    cache_key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(cache_key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
     try:
         decoded = jwt.decode(
             token,
@@ -55,6 +75,14 @@ def verify_token(token: str) -> dict:
             options={"verify_aud": True}
         )
 
+        expires = now + TOKEN_CACHE_TTL
+        if isinstance(decoded.get("exp"), (int, float)):
+            expires = min(expires, decoded["exp"])
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_SIZE:
+                _token_cache.clear()
+            _token_cache[cache_key] = (expires, decoded)
+
         return decoded
 
     except jwt.ExpiredSignatureError:
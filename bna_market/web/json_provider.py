@@ -0,0 +1,51 @@
+"""
+orjson-backed JSON provider for the Flask app
+
+Serializes UUID, datetime and date values natively (ISO 8601), so route
+handlers can pass database rows through without per-field str()/isoformat()
+calls.
+"""
+
+import decimal
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+# Match the stdlib encoder, which accepts int/float/bool/None dict keys
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively"""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider using orjson for encoding and decoding
+
+    Differences from Flask's default provider:
+    - datetime/date values are emitted as ISO 8601 instead of HTTP dates
+    - keys are not sorted and output is always compact
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default, option=_OPTIONS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Skip the bytes -> str -> bytes round trip of the base implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=_OPTIONS), mimetype="application/json"
+        )
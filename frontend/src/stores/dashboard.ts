@@ -90,6 +90,24 @@ export const useDashboardStore = defineStore('dashboard', () => {
 
   const hasActiveFilters = computed(() => activeFilters.value.length > 0);
 
+  // FRED observations grouped by metric in one pass, each series oldest first.
+  // Dates are YYYY-MM-DD strings, so they sort correctly as strings.
+  const fredSeries = computed(() => {
+    const series = new Map<string, FredMetric[]>();
+    for (const metric of fredMetrics.value) {
+      const points = series.get(metric.metricName);
+      if (points) {
+        points.push(metric);
+      } else {
+        series.set(metric.metricName, [metric]);
+      }
+    }
+    for (const points of series.values()) {
+      points.sort((a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0));
+    }
+    return series;
+  });
+
   const relativeFreshness = computed(() => {
     if (!lastUpdated.value) return null;
 
@@ -249,6 +267,7 @@ export const useDashboardStore = defineStore('dashboard', () => {
     activeFilters,
     hasActiveFilters,
     relativeFreshness,
+    fredSeries,
 
     // Actions
     loadDashboard,
@@ -0,0 +1,19 @@
+"""
+Gunicorn settings for self-hosted deployments (the Vercel function does not use this)
+
+Usage:
+    gunicorn "bna_market.web.app:create_app()"
+
+Every API route blocks on Postgres I/O, and psycopg2 releases the GIL while
+waiting on the server, so threaded workers let one process serve several
+requests at once. Keep threads at or below the connection pool size
+(DB_POOL_MAX_CONN, default 10) so no thread waits on a connection.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+timeout = 60
@@ -0,0 +1,41 @@
+-- Case-insensitive unique list names
+-- Lets create_list use INSERT ... ON CONFLICT (user_id, lower(name)) DO NOTHING
+-- instead of relying on a UniqueViolation (and transaction abort) for duplicates
+
+-- ============================================
+-- Phase 1: Rename existing case-only duplicates
+-- ============================================
+
+-- The old UNIQUE(user_id, name) constraint allowed names that differ only by
+-- case ("Favorites" and "favorites"), which would make the index below fail
+-- to build. Keep the oldest list of each group as is and suffix the others
+-- with the start of their id (truncated to stay within the 100-char limit).
+WITH ranked AS (
+  SELECT id,
+         row_number() OVER (
+           PARTITION BY user_id, lower(name)
+           ORDER BY created_at, id
+         ) AS rn
+  FROM public.user_property_lists
+)
+UPDATE public.user_property_lists AS t
+SET name = left(t.name, 89) || ' (' || left(t.id::text, 8) || ')'
+FROM ranked
+WHERE ranked.id = t.id
+  AND ranked.rn > 1;
+
+-- ============================================
+-- Phase 2: Unique expression index
+-- ============================================
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_property_lists_user_lower_name
+ON public.user_property_lists (user_id, lower(name));
+
+-- ============================================
+-- Phase 3: Drop the case-sensitive constraint
+-- ============================================
+
+-- The new index is strictly stronger (it also rejects case-only duplicates),
+-- so the old constraint only adds index maintenance
+ALTER TABLE public.user_property_lists
+DROP CONSTRAINT IF EXISTS unique_user_list_name;
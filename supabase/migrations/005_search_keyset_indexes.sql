@@ -0,0 +1,9 @@
+-- Keyset pagination indexes for /api/properties/search
+-- Match SEARCH_ORDER_BY in bna_market/web/api/routes.py so a cursor page is an
+-- index range scan of per_page rows instead of an OFFSET scan
+
+CREATE INDEX IF NOT EXISTS idx_forsale_price_zpid_snapshot
+ON bna_forsale(price DESC NULLS LAST, zpid DESC, snapshot_date DESC);
+
+CREATE INDEX IF NOT EXISTS idx_rentals_price_zpid_snapshot
+ON bna_rentals(price DESC NULLS LAST, zpid DESC, snapshot_date DESC);
@@ -0,0 +1,20 @@
+-- Indexes for the /api/properties/search and /export range filters
+-- (min/max price, beds, sqft). Price-only ranges are already served by the
+-- keyset indexes from 005; these let bedroom/size filters use a range scan
+-- on the leading columns instead of a full table scan.
+
+CREATE INDEX IF NOT EXISTS idx_forsale_price_beds_sqft
+ON bna_forsale(price, bedrooms, living_area);
+
+CREATE INDEX IF NOT EXISTS idx_rentals_price_beds_sqft
+ON bna_rentals(price, bedrooms, living_area);
+
+CREATE INDEX IF NOT EXISTS idx_forsale_beds_price
+ON bna_forsale(bedrooms, price);
+
+CREATE INDEX IF NOT EXISTS idx_rentals_beds_price
+ON bna_rentals(bedrooms, price);
+
+-- Refresh planner statistics so the new indexes are considered immediately
+ANALYZE bna_forsale;
+ANALYZE bna_rentals;
@@ -0,0 +1,25 @@
+-- Trigram indexes for the /api/properties/search and /export address filters.
+-- The city filter (LOWER(address) LIKE '%city%') and the ZIP filter
+-- (address LIKE '%37201%') use leading wildcards, which a B-tree cannot
+-- serve. pg_trgm GIN indexes answer these substring matches from the index
+-- instead of scanning and lower-casing every row.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- City filter: expression index matching LOWER(address)
+CREATE INDEX IF NOT EXISTS idx_forsale_address_lower_trgm
+ON bna_forsale USING GIN (LOWER(address) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_rentals_address_lower_trgm
+ON bna_rentals USING GIN (LOWER(address) gin_trgm_ops);
+
+-- ZIP code filter: plain address column
+CREATE INDEX IF NOT EXISTS idx_forsale_address_trgm
+ON bna_forsale USING GIN (address gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_rentals_address_trgm
+ON bna_rentals USING GIN (address gin_trgm_ops);
+
+-- Refresh planner statistics so the new indexes are considered immediately
+ANALYZE bna_forsale;
+ANALYZE bna_rentals;
@@ -0,0 +1,31 @@
+-- Covering sort indexes for the /api/dashboard, /export and FRED queries.
+-- The dashboard and export order listings by "price DESC NULLS LAST" so that
+-- unpriced listings never fill the row cap ahead of priced ones. These indexes
+-- match that ordering and INCLUDE the selected columns, letting the planner walk
+-- the index (stopping at the LIMIT) without a Sort node or heap lookups. The
+-- dashboard KPI aggregates (COUNT/AVG over price > 0) still read every priced
+-- row, but as an Index Only Scan over the same index rather than the heap.
+--
+-- Verify with EXPLAIN ANALYZE that the plans show an Index Only Scan and no Sort.
+-- On a large live table, run each statement by hand as CREATE INDEX CONCURRENTLY
+-- (which cannot run inside the migration transaction) to avoid blocking writes.
+
+CREATE INDEX IF NOT EXISTS idx_forsale_price_desc_covering
+ON bna_forsale(price DESC NULLS LAST)
+INCLUDE (zpid, address, bedrooms, bathrooms, living_area, property_type,
+         latitude, longitude, img_src, detail_url, days_on_zillow, listing_status);
+
+CREATE INDEX IF NOT EXISTS idx_rentals_price_desc_covering
+ON bna_rentals(price DESC NULLS LAST)
+INCLUDE (zpid, address, bedrooms, bathrooms, living_area, property_type,
+         latitude, longitude, img_src, detail_url, days_on_zillow, listing_status);
+
+-- FRED metrics: ORDER BY date DESC, metric_name
+CREATE INDEX IF NOT EXISTS idx_fred_date_metric_covering
+ON bna_fred_metrics(date DESC, metric_name)
+INCLUDE (series_id, value);
+
+-- Refresh planner statistics so the new indexes are considered immediately
+ANALYZE bna_forsale;
+ANALYZE bna_rentals;
+ANALYZE bna_fred_metrics;
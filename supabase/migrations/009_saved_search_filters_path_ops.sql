@@ -0,0 +1,14 @@
+-- Saved-search filter matching: swap the default jsonb_ops GIN index on
+-- user_saved_searches.filters for a jsonb_path_ops one. Matching queries should
+-- use containment (WHERE filters @> %s::jsonb with psycopg2.extras.Json(subset))
+-- rather than filters->>'key' = %s, which no GIN index can serve.
+-- jsonb_path_ops supports only @> (and jsonpath @?/@@), but the index is smaller
+-- and containment lookups are faster than with jsonb_ops.
+
+CREATE INDEX IF NOT EXISTS idx_saved_searches_filters_path_ops
+ON public.user_saved_searches USING GIN (filters jsonb_path_ops);
+
+-- Superseded by the jsonb_path_ops index above (nothing queries with ?, ?| or ?&)
+DROP INDEX IF EXISTS public.idx_saved_searches_filters;
+
+ANALYZE public.user_saved_searches;
@@ -0,0 +1,10 @@
+-- Index for /api/metrics/fred?metric_name=... (optionally with start_date/end_date).
+-- The covering index from 008 leads with date, so a single-metric request still
+-- walked the whole table; with metric_name first the planner reads only that
+-- metric's rows, already in date order.
+
+CREATE INDEX IF NOT EXISTS idx_fred_metric_date
+ON bna_fred_metrics(metric_name, date DESC)
+INCLUDE (series_id, value);
+
+ANALYZE bna_fred_metrics;
@@ -243,7 +243,17 @@ def flask_test_client():
 
         def execute(self, query, params=None):
             query_lower = query.lower()
-            if "count(*)" in query_lower:
+            if "union all" in query_lower:
+                # Combined dashboard listings query, tagged by source
+                self._data = (
+                    [("rentals", 2, 2000.0) + row for row in sample_rentals]
+                    + [("forsale", 2, 387500.0) + row for row in sample_forsale]
+                )
+                self._description = (
+                    [("source",), ("kpi_count",), ("kpi_avg",)]
+                    + [(col,) for col in columns_properties]
+                )
+            elif "count(*)" in query_lower:
                 if "bna_rentals" in query_lower:
                     self._data = [(2, 2000)]  # count, avg
                 else:
@@ -268,12 +278,18 @@ def flask_test_client():
         def fetchall(self):
             return self._data
 
+        def __iter__(self):
+            return iter(self._data)
+
+        def close(self):
+            pass
+
         @property
         def description(self):
             return self._description
 
     class SmartMockConnection:
-        def cursor(self):
+        def cursor(self, *args, **kwargs):
             return SmartMockCursor()
 
         def commit(self):
@@ -286,7 +302,7 @@ def flask_test_client():
             pass
 
     @contextmanager
-    def mock_get_db_connection():
+    def mock_get_db_connection(**kwargs):
         yield SmartMockConnection()
 
     # Patch the database connection
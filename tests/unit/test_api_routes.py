@@ -1,6 +1,7 @@
 """Comprehensive unit tests for API routes"""
 
 import pytest
+import gzip
 import json
 from unittest.mock import patch, MagicMock
 from bna_market.web.app import create_app
@@ -9,6 +10,14 @@ from bna_market.web.app import create_app
 @pytest.fixture
 def app():
     """Create and configure test app"""
+    from bna_market.web.api import routes
+
+    # Search totals, data versions and responses are cached across requests;
+    # start each test cold
+    routes._search_count_cache.clear()
+    routes._data_versions.clear()
+    routes._response_cache.clear()
+    routes._db_health["expires_at"] = 0.0
     app = create_app({"TESTING": True})
     return app
 
@@ -19,6 +28,13 @@ def client(app):
     return app.test_client()
 
 
+@pytest.fixture
+def auth_headers():
+    """Authorization header for a verified user (token verification is stubbed)"""
+    with patch("bna_market.web.auth.middleware.verify_token", return_value={"sub": "user-123"}):
+        yield {"Authorization": "Bearer test-token"}
+
+
 class TestHealthEndpoint:
     """Tests for /api/health endpoint"""
 
@@ -49,6 +65,18 @@ class TestHealthEndpoint:
         assert "/api/properties/export" in data["endpoints"]
         assert "/api/metrics/fred" in data["endpoints"]
 
+    @patch("bna_market.web.api.routes.get_ro_connection")
+    def test_health_check_reuses_recent_probe(self, mock_ro_conn, client):
+        """Should probe the database once per HEALTH_CHECK_TTL"""
+        mock_ro_conn.return_value.__enter__.return_value = MagicMock()
+
+        first = client.get("/api/health").get_json()
+        second = client.get("/api/health").get_json()
+
+        assert first["db_status"] == "connected"
+        assert second["db_status"] == "connected"
+        assert mock_ro_conn.call_count == 1
+
 
 class TestPropertiesSearchEndpoint:
     """Tests for /api/properties/search endpoint"""
@@ -184,9 +212,10 @@ class TestPropertiesExportEndpoint:
         # Setup mock
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
+        mock_cursor.fetchone.return_value = (1,)
+        mock_cursor.fetchmany.side_effect = [[
             (123, "123 Main St", 350000, 3, 2, 1800, "SINGLE_FAMILY", 36.1, -86.8, "img.jpg", "url", 30, "FOR_SALE")
-        ]
+        ], []]
         mock_cursor.description = [
             ("zpid",), ("address",), ("price",), ("bedrooms",),
             ("bathrooms",), ("living_area",), ("property_type",),
@@ -201,13 +230,22 @@ class TestPropertiesExportEndpoint:
         assert response.content_type == "text/csv"
         assert "attachment" in response.headers.get("Content-Disposition", "")
 
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[0].startswith("zpid,address,price")
+        assert lines[1].startswith("123,123 Main St,350000")
+
+        # Relative Zillow URLs are made absolute in SQL, as for search results
+        export_query = mock_cursor.execute.call_args[0][0]
+        assert "'https://www.zillow.com' || detail_url" in export_query
+
     @patch("bna_market.web.api.routes.get_db_connection")
     def test_export_filename_includes_property_type(self, mock_db_conn, client):
         """Should include property type in filename"""
         # Setup mock
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = (1,)
+        mock_cursor.fetchmany.return_value = []
         mock_cursor.description = [("zpid",)]
         mock_conn.cursor.return_value = mock_cursor
         mock_db_conn.return_value.__enter__.return_value = mock_conn
@@ -215,6 +253,63 @@ class TestPropertiesExportEndpoint:
         response = client.get("/api/properties/export?property_type=rental")
         assert "bna_rental_export.csv" in response.headers.get("Content-Disposition", "")
 
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_export_releases_cursor_and_connection(self, mock_db_conn, client):
+        """Should close the server-side cursor and release the connection after streaming"""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (1,)
+        mock_cursor.fetchmany.return_value = []
+        mock_cursor.description = [("zpid",)]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        response = client.get("/api/properties/export?property_type=forsale")
+        response.close()
+
+        mock_cursor.close.assert_called_once()
+        mock_db_conn.return_value.__exit__.assert_called_once()
+
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_export_gzips_when_accepted(self, mock_db_conn, client):
+        """Should stream gzip-encoded CSV when the client accepts gzip"""
+        import gzip
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (1,)
+        mock_cursor.fetchmany.side_effect = [[(123, "123 Main St")], []]
+        mock_cursor.description = [("zpid",), ("address",)]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        response = client.get(
+            "/api/properties/export?property_type=forsale",
+            headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.data).decode().splitlines() == [
+            "zpid,address", "123,123 Main St"
+        ]
+
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_export_rejects_oversized_result(self, mock_db_conn, client):
+        """Should return 413 without streaming when too many rows match"""
+        from bna_market.web.api.routes import MAX_EXPORT_ROWS
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (MAX_EXPORT_ROWS + 1,)
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        response = client.get("/api/properties/export?property_type=forsale")
+
+        assert response.status_code == 413
+        assert response.get_json()["totalCount"] == MAX_EXPORT_ROWS + 1
+        mock_cursor.fetchmany.assert_not_called()
+
 
 class TestFredMetricsEndpoint:
     """Tests for /api/metrics/fred endpoint"""
@@ -233,6 +328,23 @@ class TestFredMetricsEndpoint:
         response = client.get("/api/metrics/fred")
         assert response.status_code == 200
 
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_fred_metrics_serializes_dates_as_iso(self, mock_db_conn, client):
+        """Should return date objects as ISO strings without manual conversion"""
+        from datetime import date
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [(date(2024, 3, 1), "median_dom", "SERIES3", 34)]
+        mock_cursor.description = [("date",), ("metric_name",), ("series_id",), ("value",)]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        response = client.get("/api/metrics/fred")
+        data = response.get_json()
+
+        assert data["metrics"][0]["date"] == "2024-03-01"
+
     @patch("bna_market.web.api.routes.get_db_connection")
     def test_fred_metrics_returns_metrics_array(self, mock_db_conn, client):
         """Should return metrics array"""
@@ -271,11 +383,115 @@ class TestFredMetricsEndpoint:
 
         # Verify filters were applied
         calls = mock_cursor.execute.call_args_list
-        query = calls[0][0][0]
+        query = calls[-1][0][0]
         assert "metric_name = %s" in query
         assert "date >= %s" in query
         assert "date <= %s" in query
 
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_fred_metrics_sets_etag(self, mock_db_conn, client):
+        """Should return an ETag and short private Cache-Control"""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (42,)
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.description = [("date",), ("metric_name",), ("series_id",), ("value",)]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        response = client.get("/api/metrics/fred")
+
+        assert response.headers["ETag"] == '"42-fred"'
+        assert "max-age=30" in response.headers["Cache-Control"]
+        assert "private" in response.headers["Cache-Control"]
+
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_fred_metrics_returns_304_when_unchanged(self, mock_db_conn, client):
+        """Should skip the metrics query when If-None-Match matches"""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (42,)
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        response = client.get("/api/metrics/fred", headers={"If-None-Match": '"42-fred"'})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert mock_cursor.execute.call_count == 1
+        mock_cursor.fetchall.assert_not_called()
+
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_fred_metrics_caches_response_per_query(self, mock_db_conn, client):
+        """Should serve a repeated query from the response cache"""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (42,)
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.description = [("date",), ("metric_name",), ("series_id",), ("value",)]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        first = client.get("/api/metrics/fred?metric_name=median_dom")
+        second = client.get("/api/metrics/fred?metric_name=median_dom")
+        other = client.get("/api/metrics/fred?metric_name=active_listings")
+
+        assert "X-Cache" not in first.headers
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.data == first.data
+        assert "X-Cache" not in other.headers
+        assert mock_cursor.fetchall.call_count == 2
+
+    @patch("bna_market.web.app.gzip.compress", wraps=gzip.compress)
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_fred_metrics_cache_hit_reuses_gzipped_body(self, mock_db_conn, mock_compress, client):
+        """Should compress a cached body once and answer its weak ETag with 304"""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (42,)
+        mock_cursor.fetchall.return_value = [("2024-01-01", "median_dom", "S1", 30)] * 50
+        mock_cursor.description = [("date",), ("metric_name",), ("series_id",), ("value",)]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        gzip_headers = {"Accept-Encoding": "gzip"}
+        first = client.get("/api/metrics/fred", headers=gzip_headers)
+        second = client.get("/api/metrics/fred", headers=gzip_headers)
+        plain = client.get("/api/metrics/fred")
+        revalidated = client.get(
+            "/api/metrics/fred", headers={**gzip_headers, "If-None-Match": second.headers["ETag"]}
+        )
+
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.headers["Content-Encoding"] == "gzip"
+        assert second.headers["ETag"] == 'W/"42-fred"'
+        assert plain.headers["ETag"] == '"42-fred"'
+        assert gzip.decompress(second.data) == plain.data == gzip.decompress(first.data)
+        assert mock_compress.call_count == 1
+        assert revalidated.status_code == 304
+
+
+class TestPropertyTrendsEndpoint:
+    """Tests for /api/metrics/property-trends conditional GETs"""
+
+    @patch("bna_market.web.api.routes.get_db_connection")
+    def test_property_trends_returns_304_when_unchanged(self, mock_db_conn, client):
+        """Should honour If-None-Match using the data version and current day"""
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (7, None, None)
+        mock_cursor.fetchall.return_value = []
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        first = client.get("/api/metrics/property-trends")
+        etag = first.headers["ETag"]
+        second = client.get("/api/metrics/property-trends", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert etag.startswith('"7-')
+        assert second.status_code == 304
+
 
 class TestTableNameSecurityMapping:
     """Tests for SQL injection prevention via table name mapping"""
@@ -450,19 +666,21 @@ class TestSearchFiltersComprehensive:
 
     @patch("bna_market.web.api.routes.get_app_db_connection")
     def test_search_returns_properties_with_price_per_sqft(self, mock_db_conn, client):
-        """Should calculate pricePerSqft for properties with valid data"""
+        """Should compute pricePerSqft in SQL and return it as a number"""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         mock_cursor.fetchone.return_value = (1,)
         mock_cursor.fetchall.return_value = [
             (123, "123 Main St", 300000, 3, 2, 1500, "SINGLE_FAMILY",
-             36.1, -86.8, "img.jpg", "/homedetails/123", 10, "FOR_SALE")
+             36.1, -86.8, "img.jpg", "https://www.zillow.com/homedetails/123", 10, "FOR_SALE",
+             200.0, "2024-01-01")
         ]
         mock_cursor.description = [
             ("zpid",), ("address",), ("price",), ("bedrooms",),
             ("bathrooms",), ("living_area",), ("property_type",),
             ("latitude",), ("longitude",), ("img_src",),
-            ("detail_url",), ("days_on_zillow",), ("listing_status",)
+            ("detail_url",), ("days_on_zillow",), ("listing_status",),
+            ("price_per_sqft",), ("snapshot_date",)
         ]
         mock_conn.cursor.return_value = mock_cursor
         mock_db_conn.return_value.__enter__.return_value = mock_conn
@@ -473,22 +691,29 @@ class TestSearchFiltersComprehensive:
         assert response.status_code == 200
         assert len(data["properties"]) == 1
         assert data["properties"][0]["pricePerSqft"] == 200.0
+        assert data["properties"][0]["detailUrl"] == "https://www.zillow.com/homedetails/123"
+
+        data_query = mock_cursor.execute.call_args_list[1][0][0]
+        assert "ROUND(price::numeric / living_area, 2)" in data_query
+        assert "'https://www.zillow.com' || detail_url" in data_query
 
     @patch("bna_market.web.api.routes.get_app_db_connection")
     def test_search_handles_zero_living_area(self, mock_db_conn, client):
-        """Should handle properties with zero living area gracefully"""
+        """Should only divide by living_area when it is positive"""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         mock_cursor.fetchone.return_value = (1,)
         mock_cursor.fetchall.return_value = [
             (123, "123 Main St", 300000, 3, 2, 0, "SINGLE_FAMILY",
-             36.1, -86.8, "img.jpg", "/homedetails/123", 10, "FOR_SALE")
+             36.1, -86.8, "img.jpg", "https://www.zillow.com/homedetails/123", 10, "FOR_SALE",
+             None, "2024-01-01")
         ]
         mock_cursor.description = [
             ("zpid",), ("address",), ("price",), ("bedrooms",),
             ("bathrooms",), ("living_area",), ("property_type",),
             ("latitude",), ("longitude",), ("img_src",),
-            ("detail_url",), ("days_on_zillow",), ("listing_status",)
+            ("detail_url",), ("days_on_zillow",), ("listing_status",),
+            ("price_per_sqft",), ("snapshot_date",)
         ]
         mock_conn.cursor.return_value = mock_cursor
         mock_db_conn.return_value.__enter__.return_value = mock_conn
@@ -499,6 +724,9 @@ class TestSearchFiltersComprehensive:
         assert response.status_code == 200
         assert data["properties"][0]["pricePerSqft"] is None
 
+        data_query = mock_cursor.execute.call_args_list[1][0][0]
+        assert "WHEN price <> 0 AND living_area > 0" in data_query
+
 
 class TestExportFiltersComprehensive:
     """Additional tests for export filter coverage"""
@@ -508,7 +736,8 @@ class TestExportFiltersComprehensive:
         """Should apply all filters to export"""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = (1,)
+        mock_cursor.fetchmany.return_value = []
         mock_cursor.description = [
             ("zpid",), ("address",), ("price",), ("bedrooms",),
             ("bathrooms",), ("living_area",), ("property_type",),
@@ -559,7 +788,7 @@ class TestFredMetricsFiltersComprehensive:
         assert response.status_code == 200
 
         calls = mock_cursor.execute.call_args_list
-        query = calls[0][0][0]
+        query = calls[-1][0][0]
         assert "series_id = %s" in query
 
 
@@ -589,6 +818,27 @@ class TestZillowUrlFixer:
         assert fix_zillow_url(url) == url
 
 
+class TestRowsToProperties:
+    """Tests for rows_to_properties row builder"""
+
+    def test_rows_to_properties_converts_keys(self):
+        """Should camelCase keys and pass values through unchanged"""
+        from bna_market.web.api.routes import rows_to_properties
+
+        result = rows_to_properties(
+            ["zpid", "living_area", "price_per_sqft", "bathrooms", "address"],
+            [(1, 1800.0, 194.44, None, "123 Main St")]
+        )
+
+        assert result == [{
+            "zpid": 1,
+            "livingArea": 1800.0,
+            "pricePerSqft": 194.44,
+            "bathrooms": None,
+            "address": "123 Main St",
+        }]
+
+
 class TestErrorHandling:
     """Tests for error handling in routes"""
 
@@ -634,3 +884,377 @@ class TestErrorHandling:
         assert response.status_code == 200
         data = response.get_json()
         assert data["pagination"]["perPage"] == 100
+
+
+class TestSearchKeysetPagination:
+    """Tests for cursor-based pagination on /api/properties/search"""
+
+    def _mock_cursor(self, rows):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (len(rows),)
+        mock_cursor.fetchall.return_value = rows
+        mock_cursor.description = [
+            ("zpid",), ("address",), ("price",), ("bedrooms",),
+            ("bathrooms",), ("living_area",), ("property_type",),
+            ("latitude",), ("longitude",), ("img_src",),
+            ("detail_url",), ("days_on_zillow",), ("listing_status",),
+            ("snapshot_date",)
+        ]
+        return mock_cursor
+
+    @patch("bna_market.web.api.routes.get_app_db_connection")
+    def test_search_returns_next_cursor_when_more_rows(self, mock_db_conn, client):
+        """Should emit nextCursor from the last row of a full page"""
+        from bna_market.web.api.routes import decode_search_cursor
+
+        rows = [
+            (i, "addr", 300000 - i, 3, 2, 1500, "SINGLE_FAMILY",
+             36.1, -86.8, None, None, 1, "FOR_SALE", "2024-01-01")
+            for i in range(3)
+        ]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = self._mock_cursor(rows)
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        response = client.get("/api/properties/search?property_type=forsale&per_page=2")
+        data = response.get_json()
+
+        assert len(data["properties"]) == 2
+        assert "snapshotDate" not in data["properties"][0]
+        assert decode_search_cursor(data["pagination"]["nextCursor"]) == ["299999", "1", "2024-01-01"]
+
+    @patch("bna_market.web.api.routes.get_app_db_connection")
+    def test_search_with_cursor_seeks_instead_of_offset(self, mock_db_conn, client):
+        """Should add a keyset condition and drop OFFSET when a cursor is given"""
+        from bna_market.web.api.routes import encode_search_cursor
+
+        mock_cursor = self._mock_cursor([])
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        token = encode_search_cursor(250000, 42, "2024-01-01")
+        response = client.get(f"/api/properties/search?property_type=forsale&cursor={token}")
+        assert response.status_code == 200
+
+        # Cursor pages skip COUNT(*), so the data query is the only one
+        assert mock_cursor.execute.call_count == 1
+        data_query, data_params = mock_cursor.execute.call_args_list[0][0]
+        assert "(price, zpid, snapshot_date) < (%s, %s, %s)" in data_query
+        assert "OFFSET" not in data_query
+        assert data_params[:3] == ["250000", "42", "2024-01-01"]
+        assert response.get_json()["pagination"]["nextCursor"] is None
+
+    @patch("bna_market.web.api.routes.get_app_db_connection")
+    def test_search_rejects_malformed_cursor(self, mock_db_conn, client):
+        """Should return 400 for a cursor that doesn't decode"""
+        response = client.get("/api/properties/search?property_type=forsale&cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("key", [
+        [[250000], 42, "2024-01-01"],
+        [250000, {"zpid": 42}, "2024-01-01"],
+        [250000, 42, True],
+    ])
+    @patch("bna_market.web.api.routes.get_app_db_connection")
+    def test_search_rejects_cursor_with_non_scalar_key(self, mock_db_conn, key, client):
+        """Should return 400 when a cursor element isn't a string, number or null"""
+        import base64
+
+        token = base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+        response = client.get(f"/api/properties/search?property_type=forsale&cursor={token}")
+
+        assert response.status_code == 400
+        mock_db_conn.assert_not_called()
+
+    @patch("bna_market.web.api.routes.get_app_db_connection")
+    def test_search_reuses_cached_total_count(self, mock_db_conn, client):
+        """Should only run COUNT(*) once for repeated identical filters"""
+        mock_cursor = self._mock_cursor([])
+        mock_cursor.fetchone.return_value = (42,)
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+        url = "/api/properties/search?property_type=rental&min_beds=2"
+        client.get(url)
+        response = client.get(url + "&page=2")
+
+        count_queries = [
+            c for c in mock_cursor.execute.call_args_list if "COUNT(*)" in c[0][0]
+        ]
+        assert len(count_queries) == 1
+        assert response.get_json()["pagination"]["totalCount"] == 42
+
+
+class TestSavedSearchesBulkEndpoint:
+    """Tests for POST /api/searches/bulk"""
+
+    @patch("bna_market.web.api.searches_routes.psycopg2.extras.execute_values")
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_bulk_save_reports_inserted_and_skipped(self, mock_db_conn, mock_execute_values,
+                                                    client, auth_headers):
+        """Should insert all rows at once and count names the user already has"""
+        mock_db_conn.return_value.__enter__.return_value = MagicMock()
+        mock_execute_values.return_value = [
+            ("id-1", "Cheap", "rental", {}, "2024-01-01", "2024-01-01")
+        ]
+
+        response = client.post("/api/searches/bulk", headers=auth_headers, json=[
+            {"name": "Cheap", "propertyType": "rental"},
+            {"name": "Existing", "propertyType": "forsale", "filters": {"minBeds": 2}},
+        ])
+
+        assert response.status_code == 201
+        data = response.get_json()
+        assert [s["name"] for s in data["searches"]] == ["Cheap"]
+        assert data["skipped"] == 1
+        rows = mock_execute_values.call_args[0][2]
+        assert [row[1] for row in rows] == ["Cheap", "Existing"]
+
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_bulk_save_rejects_too_many_searches(self, mock_db_conn, client, auth_headers):
+        """Should return 400 above MAX_BULK_SEARCHES without touching the database"""
+        from bna_market.web.api.searches_routes import MAX_BULK_SEARCHES
+
+        searches = [
+            {"name": f"Search {i}", "propertyType": "rental"} for i in range(MAX_BULK_SEARCHES + 1)
+        ]
+        response = client.post("/api/searches/bulk", headers=auth_headers, json=searches)
+
+        assert response.status_code == 400
+        mock_db_conn.assert_not_called()
+
+    @pytest.mark.parametrize("item", [
+        "not an object",
+        {"name": 123, "propertyType": "rental"},
+        {"name": "Valid", "propertyType": ["rental"]},
+        {"name": "Valid", "propertyType": "condo"},
+    ])
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_bulk_save_rejects_malformed_item(self, mock_db_conn, item, client, auth_headers):
+        """Should return 400 naming the index of the first invalid search"""
+        response = client.post("/api/searches/bulk", headers=auth_headers, json=[
+            {"name": "Valid", "propertyType": "rental"},
+            item,
+        ])
+
+        assert response.status_code == 400
+        assert response.get_json()["error"].startswith("Search 1")
+        mock_db_conn.assert_not_called()
+
+
+def _mock_write_connection(mock_db_conn, fetchone_result):
+    """Wire a get_db_connection patch to a cursor returning one fetchone() row"""
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_cursor.fetchone.return_value = fetchone_result
+    mock_conn.cursor.return_value = mock_cursor
+    mock_db_conn.return_value.__enter__.return_value = mock_conn
+    return mock_cursor
+
+
+class TestListNameConflicts:
+    """Tests for case-insensitive list name uniqueness on create and rename"""
+
+    LIST_ID = "11111111-1111-1111-1111-111111111111"
+
+    @patch("bna_market.web.api.lists_routes.get_db_connection")
+    def test_create_list_rejects_case_only_duplicate(self, mock_db_conn, client, auth_headers):
+        """Should return 409 when ON CONFLICT on lower(name) skips the insert"""
+        mock_cursor = _mock_write_connection(mock_db_conn, None)
+
+        response = client.post("/api/lists", headers=auth_headers, json={"name": "DOWNTOWN"})
+
+        assert response.status_code == 409
+        query = mock_cursor.execute.call_args[0][0]
+        assert "ON CONFLICT (user_id, lower(name)) DO NOTHING" in query
+
+    @patch("bna_market.web.api.lists_routes.get_db_connection")
+    def test_update_list_rejects_rename_collision(self, mock_db_conn, client, auth_headers):
+        """Should return 409 when another list already has the new name"""
+        mock_cursor = _mock_write_connection(mock_db_conn, (True, None, None, None, None, None))
+
+        response = client.put(f"/api/lists/{self.LIST_ID}", headers=auth_headers,
+                              json={"name": "downtown"})
+
+        assert response.status_code == 409
+        params = mock_cursor.execute.call_args[0][1]
+        assert params[:2] == ["user-123", "downtown"]
+
+    @patch("bna_market.web.api.lists_routes.get_db_connection")
+    def test_update_list_returns_404_for_missing_list(self, mock_db_conn, client, auth_headers):
+        """Should return 404 when no list with that id belongs to the user"""
+        _mock_write_connection(mock_db_conn, (False, None, None, None, None, None))
+
+        response = client.put(f"/api/lists/{self.LIST_ID}", headers=auth_headers,
+                              json={"description": "Updated"})
+
+        assert response.status_code == 404
+
+
+class TestSavedSearchNameConflicts:
+    """Tests for case-insensitive saved search name uniqueness on save and rename"""
+
+    SEARCH_ID = "22222222-2222-2222-2222-222222222222"
+
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_save_search_rejects_case_only_duplicate(self, mock_db_conn, client, auth_headers):
+        """Should return 409 when ON CONFLICT on lower(name) skips the insert"""
+        mock_cursor = _mock_write_connection(mock_db_conn, None)
+
+        response = client.post("/api/searches", headers=auth_headers,
+                               json={"name": "CHEAP RENTALS", "propertyType": "rental"})
+
+        assert response.status_code == 409
+        query = mock_cursor.execute.call_args[0][0]
+        assert "ON CONFLICT (user_id, lower(name)) DO NOTHING" in query
+
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_update_search_rejects_rename_collision(self, mock_db_conn, client, auth_headers):
+        """Should return 409 when another saved search already has the new name"""
+        mock_cursor = _mock_write_connection(
+            mock_db_conn, (True, None, None, None, None, None, None)
+        )
+
+        response = client.put(f"/api/searches/{self.SEARCH_ID}", headers=auth_headers,
+                              json={"name": "cheap rentals"})
+
+        assert response.status_code == 409
+        params = mock_cursor.execute.call_args[0][1]
+        assert params[:2] == ["user-123", "cheap rentals"]
+
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_update_search_returns_404_for_missing_search(self, mock_db_conn, client,
+                                                          auth_headers):
+        """Should return 404 when no saved search with that id belongs to the user"""
+        _mock_write_connection(mock_db_conn, (False, None, None, None, None, None, None))
+
+        response = client.put(f"/api/searches/{self.SEARCH_ID}", headers=auth_headers,
+                              json={"filters": {"minBeds": 2}})
+
+        assert response.status_code == 404
+
+
+class TestSavedSearchConditionalGets:
+    """Tests for If-None-Match handling on saved search GETs"""
+
+    SEARCH_ID = "22222222-2222-2222-2222-222222222222"
+
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_searches_list_returns_304_when_body_unchanged(self, mock_db_conn, client,
+                                                           auth_headers):
+        """Should version the list by a hash of its body"""
+        mock_cursor = _mock_write_connection(mock_db_conn, ('[{"name": "Cheap"}]',))
+
+        first = client.get("/api/searches", headers=auth_headers)
+        etag = first.headers["ETag"]
+        second = client.get("/api/searches", headers={**auth_headers, "If-None-Match": etag})
+
+        mock_cursor.fetchone.return_value = ('[{"name": "Cheap"}, {"name": "New"}]',)
+        changed = client.get("/api/searches", headers={**auth_headers, "If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.get_json() == {"searches": [{"name": "Cheap"}]}
+        assert "private" in first.headers["Cache-Control"]
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    @patch("bna_market.web.api.searches_routes.get_db_connection")
+    def test_single_search_returns_304_until_updated_at_changes(self, mock_db_conn, client,
+                                                                auth_headers):
+        """Should version one search by its id and updated_at"""
+        from datetime import datetime
+
+        row = (self.SEARCH_ID, "Cheap", "rental", {}, datetime(2024, 1, 1), datetime(2024, 1, 2))
+        mock_cursor = _mock_write_connection(mock_db_conn, row)
+        url = f"/api/searches/{self.SEARCH_ID}"
+
+        first = client.get(url, headers=auth_headers)
+        etag = first.headers["ETag"]
+        second = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+        mock_cursor.fetchone.return_value = row[:5] + (datetime(2024, 1, 3),)
+        changed = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.get_json()["name"] == "Cheap"
+        assert second.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+
+class TestListItemStreaming:
+    """Tests for streaming large lists from GET /api/lists/<id>"""
+
+    LIST_ID = "11111111-1111-1111-1111-111111111111"
+
+    @staticmethod
+    def _item_rows(count):
+        return [(i, 1000 + i, "rental", None, "2024-01-01") for i in range(count)]
+
+    @staticmethod
+    def _list_row(item_count):
+        return ("list-1", "Downtown", None, "2024-01-01", "2024-01-02", item_count)
+
+    @staticmethod
+    def _stream_cursor(mock_db_conn, rows):
+        """Server-side cursor handing out rows in fetchmany() batches"""
+        from bna_market.web.api.lists_routes import STREAM_BATCH_SIZE
+
+        batches = [rows[i:i + STREAM_BATCH_SIZE] for i in range(0, len(rows), STREAM_BATCH_SIZE)]
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.side_effect = batches + [[]]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_db_conn.return_value.__enter__.return_value = mock_conn
+        return mock_cursor
+
+    @patch("bna_market.web.api.lists_routes.get_db_connection")
+    @patch("bna_market.web.api.lists_routes.get_ro_connection")
+    def test_large_list_streams_valid_json(self, mock_ro_conn, mock_db_conn, client,
+                                           auth_headers):
+        """Should stream every item of a list above the threshold as one JSON object"""
+        _mock_write_connection(mock_ro_conn, self._list_row(600))
+        stream_cursor = self._stream_cursor(mock_db_conn, self._item_rows(600))
+
+        response = client.get(f"/api/lists/{self.LIST_ID}", headers=auth_headers)
+        data = json.loads(response.get_data())
+
+        assert response.status_code == 200
+        assert data["name"] == "Downtown"
+        assert data["itemCount"] == 600
+        assert [item["zpid"] for item in data["items"]] == [1000 + i for i in range(600)]
+        stream_conn = mock_db_conn.return_value.__enter__.return_value
+        assert stream_conn.cursor.call_args.kwargs["name"].startswith("items_")
+        stream_cursor.close.assert_called_once()
+
+    @patch("bna_market.web.api.lists_routes.get_db_connection")
+    @patch("bna_market.web.api.lists_routes.get_ro_connection")
+    def test_list_at_threshold_is_buffered(self, mock_ro_conn, mock_db_conn, client,
+                                           auth_headers):
+        """Should serve exactly STREAM_ITEMS_THRESHOLD items without streaming"""
+        from bna_market.web.api.lists_routes import STREAM_ITEMS_THRESHOLD
+
+        mock_cursor = _mock_write_connection(mock_ro_conn, self._list_row(STREAM_ITEMS_THRESHOLD))
+        mock_cursor.fetchall.return_value = self._item_rows(STREAM_ITEMS_THRESHOLD)
+
+        response = client.get(f"/api/lists/{self.LIST_ID}", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert len(response.get_json()["items"]) == STREAM_ITEMS_THRESHOLD
+        mock_db_conn.assert_not_called()
+
+    @patch("bna_market.web.api.lists_routes.get_db_connection")
+    def test_stream_list_items_handles_empty_list(self, mock_db_conn):
+        """Should still produce a valid object when the cursor yields no rows"""
+        from bna_market.web.api.lists_routes import _stream_list_items
+
+        self._stream_cursor(mock_db_conn, [])
+        list_data = {"id": "list-1", "name": "Empty", "itemCount": 0}
+
+        body = b"".join(_stream_list_items(list_data, self.LIST_ID))
+
+        assert json.loads(body) == {**list_data, "items": []}
@@ -11,7 +11,7 @@ from bna_market.pipelines.fred_metrics import fetch_fred_metrics
 class TestForSalePipeline:
     """Tests for for-sale pipeline"""
 
-    @patch("bna_market.pipelines.zillow_base.requests.get")
+    @patch("bna_market.pipelines.zillow_base._session.get")
     def test_forsale_pipe_returns_dataframe(self, mock_get, sample_zillow_response):
         """Should return DataFrame with property data"""
         mock_get.return_value.status_code = 200
@@ -24,7 +24,32 @@ class TestForSalePipeline:
         assert "zpid" in result.columns
         assert "price" in result.columns
 
-    @patch("bna_market.pipelines.zillow_base.requests.get")
+    @patch("bna_market.pipelines.zillow_base.time.sleep")
+    @patch("bna_market.pipelines.zillow_base._session.get")
+    def test_forsale_pipe_stops_at_total_pages(self, mock_get, mock_sleep, sample_zillow_response):
+        """Should only request the pages reported by totalPages"""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {**sample_zillow_response, "totalPages": 3}
+
+        result = fetch_for_sale_properties()
+
+        assert len(result) == 2
+        pages = sorted(int(call.kwargs["params"]["page"]) for call in mock_get.call_args_list)
+        assert pages == [1, 2, 3]
+
+    @patch("bna_market.pipelines.zillow_base.time.sleep")
+    @patch("bna_market.pipelines.zillow_base.time.monotonic", return_value=100.0)
+    def test_rate_gate_spaces_calls_across_threads(self, mock_monotonic, mock_sleep):
+        """Should give each caller the next slot, one interval apart"""
+        from bna_market.pipelines.zillow_base import RateGate
+
+        gate = RateGate(0.5)
+        for _ in range(3):
+            gate.wait()
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("bna_market.pipelines.zillow_base._session.get")
     def test_forsale_pipe_handles_empty_response(self, mock_get):
         """Should return empty DataFrame on empty API response"""
         mock_get.return_value.status_code = 200
@@ -47,7 +72,7 @@ class TestForSalePipeline:
 class TestRentalPipeline:
     """Tests for rental pipeline"""
 
-    @patch("bna_market.pipelines.zillow_base.requests.get")
+    @patch("bna_market.pipelines.zillow_base._session.get")
     def test_rental_pipe_returns_dataframe(self, mock_get, sample_zillow_response):
         """Should return DataFrame with rental data"""
         mock_get.return_value.status_code = 200
@@ -58,6 +83,22 @@ class TestRentalPipeline:
         assert isinstance(result, pd.DataFrame)
         assert len(result) >= 0
 
+    def test_explode_units_adds_one_row_per_unit(self):
+        """Should expand units into suffixed columns and keep unparseable rows"""
+        from bna_market.pipelines.rental import explode_units
+
+        df = pd.DataFrame({
+            "zpid": [1, 2],
+            "units": ["[{'beds': 1, 'price': '$1,200'}, {'beds': 2, 'price': '$1,500'}]", None],
+        })
+
+        result = explode_units(df)
+
+        assert result["zpid"].tolist() == [1, 1, 2]
+        assert result["price_unit"].tolist()[:2] == ["$1,200", "$1,500"]
+        assert pd.isna(result["beds_unit"].iloc[2])
+        assert "0_unit" not in result.columns
+
     def test_rental_pipe_requires_api_key(self, monkeypatch):
         """Should raise ValueError if API key missing"""
         # Set env var to empty string (monkeypatch.delenv doesn't work after load_dotenv)
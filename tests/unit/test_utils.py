@@ -50,6 +50,82 @@ class TestDatabase:
         with pytest.raises(ValueError, match="Invalid table name"):
             read_table_safely("NONEXISTENT_TABLE", mock_conn)
 
+    def test_get_db_connection_returns_connection_to_pool(self):
+        """Should borrow from the pool and hand back a reset connection"""
+        import psycopg2.extensions
+        from bna_market.utils.database import get_db_connection
+
+        mock_conn = MagicMock()
+        mock_conn.closed = 0
+        mock_conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        mock_pool = MagicMock()
+        mock_pool.getconn.return_value = mock_conn
+
+        with patch("bna_market.utils.database._get_pool", return_value=mock_pool):
+            with get_db_connection(readonly=True) as conn:
+                assert conn is mock_conn
+                assert conn.readonly is True
+
+        mock_conn.commit.assert_called_once()
+        mock_conn.close.assert_not_called()
+        mock_pool.putconn.assert_called_once_with(mock_conn)
+        assert mock_conn.readonly is None
+        assert mock_conn.autocommit is False
+
+    def test_get_ro_connection_sets_readonly_autocommit_session(self):
+        """Should hand out a read-only autocommit session and reset it on release"""
+        import psycopg2.extensions
+        from bna_market.utils.database import get_ro_connection
+
+        mock_conn = MagicMock()
+        mock_conn.closed = 0
+        mock_conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        mock_pool = MagicMock()
+        mock_pool.getconn.return_value = mock_conn
+
+        with patch("bna_market.utils.database._get_pool", return_value=mock_pool):
+            with get_ro_connection() as conn:
+                assert conn is mock_conn
+
+        mock_conn.set_session.assert_called_once_with(readonly=True, autocommit=True)
+        mock_pool.putconn.assert_called_once_with(mock_conn)
+        assert mock_conn.readonly is None
+        assert mock_conn.autocommit is False
+
+    def test_pool_keeps_idle_connections_until_timeout(self):
+        """Should keep connections beyond minconn and replace ones idle too long"""
+        import psycopg2.extensions
+        from bna_market.utils.database import IdleTimeoutConnectionPool
+
+        def new_conn(*args, **kwargs):
+            conn = MagicMock()
+            conn.closed = 0
+            conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+            conn.close.side_effect = lambda: setattr(conn, "closed", 1)
+            return conn
+
+        with patch("psycopg2.connect", side_effect=new_conn), \
+                patch("bna_market.utils.database.time.monotonic", return_value=0):
+            pool = IdleTimeoutConnectionPool(1, 5, 3, 300)
+            conns = [pool.getconn() for _ in range(3)]
+            for conn in conns:
+                pool.putconn(conn)
+            assert not any(conn.closed for conn in conns)
+
+        with patch("psycopg2.connect", side_effect=new_conn), \
+                patch("bna_market.utils.database.time.monotonic", return_value=301):
+            fresh = pool.getconn()
+
+        assert fresh not in conns
+        assert all(conn.closed for conn in conns)
+
+    def test_numeric_typecaster_returns_float(self):
+        """Should cast NUMERIC values to float and keep NULLs"""
+        from bna_market.utils.database import DEC2FLOAT
+
+        assert DEC2FLOAT("194.44", None) == 194.44
+        assert DEC2FLOAT(None, None) is None
+
     def test_valid_table_names_whitelist(self):
         """Should have correct valid table names"""
         assert "bna_forsale" in VALID_TABLE_NAMES
@@ -67,6 +143,29 @@ class TestLogger:
         assert logger is not None
         assert logger.name == "test"
 
+    def test_setup_logger_with_queue_uses_queue_handler(self):
+        """Should route records through a single QueueHandler"""
+        import logging.handlers
+
+        logger = setup_logger("test_queued", use_queue=True)
+
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+    def test_queued_logger_formats_message_at_call_site(self):
+        """Should merge args before queueing so later mutation can't change the message"""
+        import logging
+
+        logger = setup_logger("test_queued", use_queue=True)
+        args = {"zpid": 1}
+        record = logger.makeRecord(logger.name, logging.INFO, __file__, 0, "props %s", (args,), None)
+
+        prepared = logger.handlers[0].prepare(record)
+        args["zpid"] = 2
+
+        assert prepared.getMessage() == "props {'zpid': 1}"
+        assert prepared.args is None
+
 
 class TestValidators:
     """Tests for validation utilities"""
@@ -9,6 +9,15 @@ from contextlib import contextmanager
 from bna_market.web.app import create_app
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """The dashboard payload and data version are memoized; start each test cold"""
+    from bna_market.web.api import routes
+
+    routes._response_cache.clear()
+    routes._data_versions.clear()
+
+
 class MockCursor:
     """Mock database cursor for testing"""
 
@@ -36,7 +45,7 @@ class MockConnection:
     def __init__(self, cursor):
         self._cursor = cursor
 
-    def cursor(self):
+    def cursor(self, *args, **kwargs):
         return self._cursor
 
     def commit(self):
@@ -89,12 +98,16 @@ def mock_db_with_data():
 
         def execute(self, query, params=None):
             query_lower = query.lower()
-            if "count(*)" in query_lower and "avg" in query_lower:
-                if "bna_rentals" in query_lower:
-                    self._data = [(2, 2000)]
-                else:
-                    self._data = [(2, 385000)]
-                self._description = [("count",), ("avg_price",)]
+            if "union all" in query_lower:
+                # Combined listings query: rentals then for-sale, tagged by source
+                self._data = (
+                    [("rentals", 2, 2000.0) + row for row in rentals_data]
+                    + [("forsale", 2, 385000.0) + row for row in forsale_data]
+                )
+                self._description = (
+                    [("source",), ("kpi_count",), ("kpi_avg",)]
+                    + [(col,) for col in property_columns]
+                )
             elif "bna_rentals" in query_lower:
                 self._data = rentals_data
                 self._description = [(col,) for col in property_columns]
@@ -114,12 +127,18 @@ def mock_db_with_data():
         def fetchall(self):
             return self._data
 
+        def __iter__(self):
+            return iter(self._data)
+
+        def close(self):
+            pass
+
         @property
         def description(self):
             return self._description
 
     class SmartMockConnection:
-        def cursor(self):
+        def cursor(self, *args, **kwargs):
             return SmartMockCursor()
 
         def commit(self):
@@ -132,7 +151,7 @@ def mock_db_with_data():
             pass
 
     @contextmanager
-    def mock_get_db():
+    def mock_get_db(**kwargs):
         yield SmartMockConnection()
 
     return mock_get_db
@@ -148,26 +167,27 @@ def mock_empty_db():
             self._description = []
 
         def execute(self, query, params=None):
-            query_lower = query.lower()
-            if "count(*)" in query_lower:
-                self._data = [(0, None)]
-                self._description = [("count",), ("avg_price",)]
-            else:
-                self._data = []
-                self._description = []
+            self._data = []
+            self._description = []
 
         def fetchone(self):
-            return self._data[0] if self._data else (0, None)
+            return self._data[0] if self._data else None
 
         def fetchall(self):
             return self._data
 
+        def __iter__(self):
+            return iter(self._data)
+
+        def close(self):
+            pass
+
         @property
         def description(self):
             return self._description
 
     class EmptyConnection:
-        def cursor(self):
+        def cursor(self, *args, **kwargs):
             return EmptyCursor()
 
         def commit(self):
@@ -180,7 +200,7 @@ def mock_empty_db():
             pass
 
     @contextmanager
-    def mock_get_db():
+    def mock_get_db(**kwargs):
         yield EmptyConnection()
 
     return mock_get_db
@@ -213,6 +233,121 @@ class TestCreateApp:
         rules = [str(rule) for rule in app.url_map.iter_rules()]
         assert "/api/dashboard" in rules
 
+    def test_app_rejects_malformed_uuid_in_path(self):
+        """Should 404 with a JSON body before reaching the handler"""
+        app = create_app(config={"TESTING": True})
+        client = app.test_client()
+
+        response = client.get("/api/lists/not-a-uuid")
+
+        assert response.status_code == 404
+        assert response.get_json() == {"error": "Not found"}
+
+    def test_app_serializes_uuid_and_datetime_natively(self):
+        """Should serialize UUID/datetime as strings without manual conversion"""
+        from datetime import datetime, timezone
+        from decimal import Decimal
+        from uuid import UUID
+
+        app = create_app()
+        payload = {
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "createdAt": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "price": Decimal("1.50"),
+        }
+
+        with app.app_context():
+            data = app.json.loads(app.json.response(payload).get_data())
+
+        assert data == {
+            "id": "12345678-1234-5678-1234-567812345678",
+            "createdAt": "2024-01-01T00:00:00+00:00",
+            "price": "1.50",
+        }
+
+    def test_app_serializes_non_string_keys(self):
+        """Should accept non-string dict keys like the stdlib encoder"""
+        app = create_app()
+
+        with app.app_context():
+            data = app.json.loads(app.json.response({1: "a", None: "b"}).get_data())
+
+        assert data == {"1": "a", "null": "b"}
+
+    def test_app_gzips_large_json_when_accepted(self):
+        """Should gzip buffered JSON above the size threshold only for gzip clients"""
+        import gzip
+
+        app = create_app(config={"TESTING": True})
+
+        @app.route("/api/test-large")
+        def large():
+            return {"items": list(range(1000))}
+
+        client = app.test_client()
+        compressed = client.get("/api/test-large", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/api/test-large")
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+        assert gzip.decompress(compressed.data) == plain.data
+        assert "Content-Encoding" not in plain.headers
+
+    def test_app_rejects_oversized_request_body(self):
+        """Should answer 413 with a JSON error before the handler parses the body"""
+        app = create_app(config={"TESTING": True})
+        client = app.test_client()
+
+        response = client.post("/api/searches", data=b"x" * (64 * 1024 + 1),
+                               content_type="application/json")
+
+        assert response.status_code == 413
+        assert response.get_json() == {"error": "Request body too large"}
+
+    def test_app_import_skips_etl_dependencies(self):
+        """Should not import pandas or the Supabase client just to serve the API"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from bna_market.web.app import create_app; create_app(); "
+            "print(sorted(m for m in ('pandas', 'supabase', 'fredapi') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_rate_limit_key_prefers_authenticated_user(self):
+        """Should count limits per user when authenticated and per IP otherwise"""
+        from flask import g
+        from bna_market.web.app import rate_limit_key
+
+        app = create_app(config={"TESTING": True})
+
+        with app.test_request_context(environ_base={"REMOTE_ADDR": "10.0.0.1"}):
+            assert rate_limit_key() == "10.0.0.1"
+            g.user_id = "user-123"
+            assert rate_limit_key() == "user:user-123"
+
+    def test_verify_token_caches_verified_payload(self):
+        """Should decode a token once and serve repeats from the cache until exp"""
+        import time
+        import jwt
+        from bna_market.web.auth import middleware
+
+        claims = {"sub": "user-123", "aud": "authenticated", "exp": int(time.time()) + 3600}
+        token = jwt.encode(claims, "test-secret-0123456789abcdef01234", algorithm="HS256")
+
+        with patch.dict(middleware.settings, {"supabase_jwt_secret": "test-secret-0123456789abcdef01234"}), \
+                patch.dict(middleware._token_cache, clear=True), \
+                patch("bna_market.web.auth.middleware.jwt.decode", wraps=jwt.decode) as mock_decode:
+            assert middleware.verify_token(token)["sub"] == "user-123"
+            assert middleware.verify_token(token)["sub"] == "user-123"
+            assert mock_decode.call_count == 1
+
+            with pytest.raises(jwt.InvalidTokenError):
+                middleware.verify_token(token + "x")
+
 
 class TestAPIDashboardRoute:
     """Tests for API dashboard endpoint (Vue frontend consumes this)"""
@@ -258,14 +393,15 @@ class TestAPIDashboardRoute:
             # Verify KPIs are calculated (2 forsale, 2 rental in mock data)
             assert data["propertyKPIs"]["totalForSaleListings"] == 2
             assert data["propertyKPIs"]["totalRentalListings"] == 2
-            assert data["propertyKPIs"]["avgSalePrice"] is not None
+            assert data["propertyKPIs"]["avgSalePrice"] == 385000
+            assert data["propertyKPIs"]["avgRentalPrice"] == 2000
 
     def test_api_dashboard_handles_db_error_gracefully(self):
         """Should return error for database connection failure"""
         app = create_app(config={"TESTING": True})
 
         @contextmanager
-        def failing_db():
+        def failing_db(**kwargs):
             raise Exception("Database connection failed")
             yield  # Never reached
 
@@ -289,6 +425,7 @@ class TestAPIDashboardRoute:
             assert response.status_code == 200
             assert "fredMetrics" in data
             assert len(data["fredMetrics"]) > 0
+            assert data["fredKPIs"] == {"activeListings": 1540, "medianDaysOnMarket": 34}
 
     def test_api_dashboard_returns_properties(self, mock_db_with_data):
         """Should return property arrays for rentals and forsale"""
@@ -302,6 +439,48 @@ class TestAPIDashboardRoute:
             assert response.status_code == 200
             assert isinstance(data["rentals"], list)
             assert isinstance(data["forsale"], list)
+            assert [p["zpid"] for p in data["rentals"]] == [3, 4]
+            assert [p["zpid"] for p in data["forsale"]] == [1, 2]
+
+    def test_api_dashboard_caps_listing_rows(self):
+        """Should pass the configured row cap to both listing queries"""
+        app = create_app(config={"TESTING": True, "DASHBOARD_ROW_CAP": 5})
+        cursor = MagicMock()
+        cursor.fetchone.return_value = None
+        cursor.description = []
+
+        @contextmanager
+        def recording_db(**kwargs):
+            yield MockConnection(cursor)
+
+        with patch("bna_market.web.api.routes.get_db_connection", recording_db):
+            response = app.test_client().get("/api/dashboard")
+
+        assert response.status_code == 200
+        listing_calls = [c for c in cursor.execute.call_args_list if "UNION ALL" in c[0][0]]
+        assert listing_calls[0][0][1] == (5, 5)
+        assert "LIMIT %s" in listing_calls[0][0][0]
+
+    def test_api_dashboard_reuses_cached_payload(self, mock_db_with_data):
+        """Should serve repeat requests for the same data version from memory"""
+        app = create_app(config={"TESTING": True})
+        client = app.test_client()
+
+        with patch("bna_market.web.api.routes.get_db_connection", mock_db_with_data):
+            first = client.get("/api/dashboard")
+
+        # Within DATA_VERSION_TTL a warm request must not touch the database
+        @contextmanager
+        def failing_db(**kwargs):
+            raise Exception("Database should not be used")
+            yield  # Never reached
+
+        with patch("bna_market.web.api.routes.get_db_connection", failing_db):
+            second = client.get("/api/dashboard")
+
+        assert second.status_code == 200
+        assert second.data == first.data
+        assert second.headers["ETag"] == first.headers["ETag"]
 
 
 class TestAppIntegration: